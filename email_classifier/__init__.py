@@ -48,7 +48,7 @@ from .processor import ProcessingStats, StreamingProcessor
 from .reporter import ClassificationReporter, ReportConfig
 
 # UI components
-from .ui import RICH_AVAILABLE, SimpleUI, TerminalUI, get_ui
+from .ui import RICH_AVAILABLE, BaseUI, SimpleUI, TerminalUI, get_ui
 
 # LLM module imports (optional - only available if LLM dependencies installed)
 try:
@@ -108,6 +108,7 @@ __all__ = [
     "get_all_profiles",
     # UI
     "get_ui",
+    "BaseUI",
     "TerminalUI",
     "SimpleUI",
     "RICH_AVAILABLE",
@@ -6,12 +6,14 @@ Uses streaming processing for memory efficiency with large files.
 """
 
 import csv
+import heapq
 import os
 import re
 import statistics
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -82,10 +84,9 @@ class AnalysisResult:
             },
             "sender_domains": {
                 "top_domains": dict(
-                    sorted(
-                        self.sender_domain_counts.items(),
-                        key=lambda x: -x[1],
-                    )[:10]
+                    heapq.nlargest(
+                        10, self.sender_domain_counts.items(), key=itemgetter(1)
+                    )
                 ),
                 "total_unique": self.total_unique_domains,
             },
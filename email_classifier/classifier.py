@@ -12,6 +12,7 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple
 
 from .domains import DOMAINS, DomainProfile, get_domain_names
@@ -21,6 +22,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Structural patterns used on every email, compiled once at import
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_NOREPLY_RE = re.compile(r"no.?reply|donotreply", re.IGNORECASE)
+
+# Sender local-part substrings that indicate a department mailbox
+_DEPARTMENT_MARKERS = (
+    "support",
+    "billing",
+    "sales",
+    "info",
+    "contact",
+    "admin",
+    "help",
+    "service",
+    "team",
+    "notifications",
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_ci(pattern: str) -> "re.Pattern[str]":
+    """Compile a case-insensitive domain pattern, shared across classifiers."""
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class StatusCallback(Protocol):
     """Protocol for status update callbacks."""
@@ -93,7 +118,7 @@ class HybridWorkflowLogger:
             self._file_handle = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of a single classification method."""
 
@@ -104,7 +129,7 @@ class ClassificationResult:
     details: dict[str, Any] | None = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailData:
     """Parsed email data structure."""
 
@@ -117,8 +142,8 @@ class EmailData:
 
     @property
     def has_url(self) -> bool:
-        """Compatibility property for classification logic."""
-        return bool(self.urls and self.urls.strip())
+        """Whether the urls field holds anything besides whitespace."""
+        return bool(self.urls) and not self.urls.isspace()
 
     @classmethod
     def from_dict(cls, data: dict) -> "EmailData":
@@ -168,19 +193,38 @@ class KeywordTaxonomyClassifier:
 
         for name, profile in self.domains.items():
             self._sender_patterns[name] = [
-                re.compile(p, re.IGNORECASE) for p in profile.sender_patterns
+                _compile_ci(p) for p in profile.sender_patterns
             ]
             self._subject_patterns[name] = [
-                re.compile(p, re.IGNORECASE) for p in profile.subject_patterns
+                _compile_ci(p) for p in profile.subject_patterns
             ]
 
-    def classify(self, email: EmailData) -> ClassificationResult:
-        """Classify email using keyword taxonomy method."""
+    def classify(
+        self,
+        email: EmailData,
+        subject_lower: str | None = None,
+        body_lower: str | None = None,
+    ) -> ClassificationResult:
+        """Classify email using keyword taxonomy method.
+
+        Callers that already lowercased the subject or body can pass them in
+        to avoid doing it again.
+        """
         scores = {}
         details = {}
 
+        if subject_lower is None:
+            subject_lower = email.subject.lower()
+        if body_lower is None:
+            body_lower = email.body.lower()
+
+        # Body word count is the same for every domain
+        body_words = len(body_lower.split())
+
         for domain_name, profile in self.domains.items():
-            score, domain_details = self._score_domain(email, domain_name, profile)
+            score, domain_details = self._score_domain(
+                email, domain_name, profile, subject_lower, body_lower, body_words
+            )
             scores[domain_name] = score
             details[domain_name] = domain_details
 
@@ -213,7 +257,13 @@ class KeywordTaxonomyClassifier:
         )
 
     def _score_domain(
-        self, email: EmailData, domain_name: str, profile: DomainProfile
+        self,
+        email: EmailData,
+        domain_name: str,
+        profile: DomainProfile,
+        subject_lower: str,
+        body_lower: str,
+        body_words: int,
     ) -> tuple[float, dict[str, Any]]:
         """Calculate score for a specific domain."""
         score = 0.0
@@ -239,26 +289,25 @@ class KeywordTaxonomyClassifier:
                 break
 
         # Check subject keywords
-        subject_lower = email.subject.lower()
         for keyword in profile.primary_keywords:
             if keyword in subject_lower:
                 score += self.WEIGHTS["subject_keyword"]
                 details["primary_matches"].append(f"subject:{keyword}")
 
         # Check body keywords
-        body_lower = email.body.lower()
-        body_words = len(body_lower.split())
-
+        # One count() pass per keyword; a zero count means no match
         primary_count = 0
         for keyword in profile.primary_keywords:
-            if keyword in body_lower:
-                primary_count += body_lower.count(keyword)
+            occurrences = body_lower.count(keyword)
+            if occurrences:
+                primary_count += occurrences
                 details["primary_matches"].append(f"body:{keyword}")
 
         secondary_count = 0
         for keyword in profile.secondary_keywords:
-            if keyword in body_lower:
-                secondary_count += body_lower.count(keyword)
+            occurrences = body_lower.count(keyword)
+            if occurrences:
+                secondary_count += occurrences
                 details["secondary_matches"].append(keyword)
 
         # Calculate keyword density score
@@ -350,10 +399,15 @@ class StructuralTemplateClassifier:
     def __init__(self, domains: dict[str, DomainProfile] | None = None) -> None:
         self.domains = domains or DOMAINS
 
-    def classify(self, email: EmailData) -> ClassificationResult:
-        """Classify email using structural template matching."""
+    def classify(
+        self, email: EmailData, body_lower: str | None = None
+    ) -> ClassificationResult:
+        """Classify email using structural template matching.
+
+        body_lower may be passed in when the caller already lowercased it.
+        """
         # Extract structural features
-        features = self._extract_features(email)
+        features = self._extract_features(email, body_lower)
 
         scores = {}
         details = {}
@@ -391,7 +445,9 @@ class StructuralTemplateClassifier:
             details={"features": features, "domain_scores": details},
         )
 
-    def _extract_features(self, email: EmailData) -> dict[str, Any]:
+    def _extract_features(
+        self, email: EmailData, body_lower: str | None = None
+    ) -> dict[str, Any]:
         """Extract structural features from email."""
         body = email.body
 
@@ -407,12 +463,15 @@ class StructuralTemplateClassifier:
         # Check for disclaimer
         has_disclaimer = any(p.search(body) for p in self.DISCLAIMER_PATTERNS)
 
-        # Count paragraphs (separated by blank lines)
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", body) if p.strip()]
-        paragraph_count = len(paragraphs)
+        # Count non-blank paragraphs (separated by blank lines) without
+        # building stripped copies of each one
+        paragraph_count = sum(
+            1 for p in _PARAGRAPH_BREAK_RE.split(body) if p and not p.isspace()
+        )
 
         # Assess formality
-        body_lower = body.lower()
+        if body_lower is None:
+            body_lower = body.lower()
         formal_count = sum(1 for ind in self.FORMAL_INDICATORS if ind in body_lower)
         casual_count = sum(1 for ind in self.CASUAL_INDICATORS if ind in body_lower)
 
@@ -439,41 +498,25 @@ class StructuralTemplateClassifier:
 
     def _analyze_sender_structure(self, sender: str) -> dict[str, Any]:
         """Analyze sender address structure."""
-        features: dict[str, Any] = {
-            "is_noreply": False,
-            "has_department": False,
-            "domain_type": "unknown",
-        }
-
-        # Check for noreply pattern
-        if re.search(r"no.?reply|donotreply", sender, re.IGNORECASE):
-            features["is_noreply"] = True
-
-        # Check for department indicators
-        dept_patterns = [
-            "support",
-            "billing",
-            "sales",
-            "info",
-            "contact",
-            "admin",
-            "help",
-            "service",
-            "team",
-            "notifications",
-        ]
-        local_part = sender.split("@")[0] if "@" in sender else sender
-        features["has_department"] = any(d in local_part for d in dept_patterns)
+        # Department indicators are matched anywhere in the local part
+        local_part = sender.partition("@")[0]
+        has_department = any(d in local_part for d in _DEPARTMENT_MARKERS)
 
         # Determine domain type
         if ".gov" in sender:
-            features["domain_type"] = "government"
+            domain_type = "government"
         elif ".edu" in sender:
-            features["domain_type"] = "education"
-        elif any(x in sender for x in [".org", ".net", ".com"]):
-            features["domain_type"] = "commercial"
+            domain_type = "education"
+        elif ".org" in sender or ".net" in sender or ".com" in sender:
+            domain_type = "commercial"
+        else:
+            domain_type = "unknown"
 
-        return features
+        return {
+            "is_noreply": _NOREPLY_RE.search(sender) is not None,
+            "has_department": has_department,
+            "domain_type": domain_type,
+        }
 
     def _score_template_match(
         self, features: dict[str, Any], profile: DomainProfile
@@ -680,8 +723,10 @@ class EmailClassifier:
         Returns:
             Tuple of (domain_name or 'unsure', classification_details)
         """
-        result1 = self.method1.classify(email)
-        result2 = self.method2.classify(email)
+        # Lowercase once for both deterministic methods
+        body_lower = email.body.lower()
+        result1 = self.method1.classify(email, email.subject.lower(), body_lower)
+        result2 = self.method2.classify(email, body_lower)
 
         # Initialize details
         details: dict[str, Any] = {
@@ -942,11 +987,14 @@ class HybridClassifier:
 
         self.stats.total_processed += 1
 
+        # Lowercase once for both deterministic methods
+        body_lower = email.body.lower()
+
         # Step 1: Run Keyword Taxonomy classifier
         self._update_status(
             "Classifying with Keyword Taxonomy...", email_idx, total_emails
         )
-        result1 = self.method1.classify(email)
+        result1 = self.method1.classify(email, email.subject.lower(), body_lower)
         if self.workflow_logger:
             self.workflow_logger.log_step(
                 email_idx, "keyword_classify", result=result1.domain
@@ -956,7 +1004,7 @@ class HybridClassifier:
         self._update_status(
             "Classifying with Structural Template...", email_idx, total_emails
         )
-        result2 = self.method2.classify(email)
+        result2 = self.method2.classify(email, body_lower)
         if self.workflow_logger:
             self.workflow_logger.log_step(
                 email_idx, "structural_classify", result=result2.domain
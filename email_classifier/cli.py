@@ -32,14 +32,14 @@ from .ui import RICH_AVAILABLE, StatusBar, get_ui
 
 if TYPE_CHECKING:
     from .llm import LLMConfig
-    from .ui import SimpleUI, TerminalUI
+    from .ui import BaseUI
 
 
 def verify_prerequisites(
     input_path: Path,
     output_dir: Path,
     use_llm: bool,
-    ui: "TerminalUI | SimpleUI",
+    ui: "BaseUI",
     quiet: bool = False,
 ) -> tuple[bool, list[str], Optional["LLMConfig"]]:
     """Verify all prerequisites before starting analysis.
@@ -422,6 +422,8 @@ def cmd_classify(args: argparse.Namespace) -> int:
     logger.info(f"Force LLM: {force_llm}")
     if args.max_body_length:
         logger.info(f"Max body length: {args.max_body_length}")
+    if args.compress_side_files:
+        logger.info("Compressing invalid/skipped email files with gzip")
     if llm_config:
         logger.info(f"LLM provider: {llm_config.provider.value}")
         logger.info(f"LLM model: {llm_config.model}")
@@ -445,6 +447,8 @@ def cmd_classify(args: argparse.Namespace) -> int:
                 )
         if args.max_body_length:
             config_opts["Max Body Length"] = f"{args.max_body_length:,} chars"
+        if args.compress_side_files:
+            config_opts["Compress Side Files"] = True
         ui.print_config(
             str(input_path),
             str(output_dir),
@@ -482,6 +486,7 @@ def cmd_classify(args: argparse.Namespace) -> int:
         strict_validation=args.strict_validation,
         max_body_length=args.max_body_length,
         use_hybrid=use_hybrid,
+        compress_side_files=args.compress_side_files,
     )
 
     # Process emails with progress tracking
@@ -538,14 +543,10 @@ def cmd_classify(args: argparse.Namespace) -> int:
                 )
         else:
             # Simple progress for non-Rich environments
-            def simple_progress(current: int, total: int, status: str) -> None:
-                if hasattr(ui, "print_progress"):
-                    ui.print_progress(current, total, status)
-
             stats = processor.process(
                 input_path=input_path,
                 output_dir=output_dir,
-                progress_callback=simple_progress if not args.quiet else None,
+                progress_callback=ui.print_progress if not args.quiet else None,
                 include_details=args.include_details,
             )
 
@@ -595,6 +596,9 @@ def cmd_classify(args: argparse.Namespace) -> int:
             # Show recommendations
             if "recommendations" in report:
                 ui.print_recommendations(report["recommendations"])
+    elif not args.quiet:
+        # No report files: only the summary and timing are needed on screen
+        ui.print_summary_panel(ClassificationReporter().generate_summary_only(stats))
 
     # Close workflow logger if used
     if workflow_logger:
@@ -801,6 +805,12 @@ Output:
         help="Skip emails with body length exceeding this limit (in characters). "
         "Skipped emails are logged to skipped_emails.csv.",
     )
+    classify_parser.add_argument(
+        "--compress-side-files",
+        action="store_true",
+        help="Write invalid_emails.csv and skipped_emails.csv gzip-compressed "
+        "(.csv.gz)",
+    )
 
     # LLM classification options
     classify_parser.add_argument(
@@ -25,6 +25,10 @@ from .validator import (
     ValidationStats,
 )
 
+# Per-run classification memo: (sender, subject, body, urls) -> classify_dict
+# result, ordered from least to most recently used
+_ClassifyCache = dict[tuple[str, str, str, str], tuple[str, dict[str, Any]]]
+
 
 @dataclass
 class HybridWorkflowProcessingStats:
@@ -94,6 +98,9 @@ class ProcessingStats:
     validation_stats: ValidationStats = field(default_factory=ValidationStats)
     # Skipped email statistics
     skipped_stats: SkippedStats = field(default_factory=SkippedStats)
+    # Side-file names as written, which depend on compress_side_files
+    invalid_emails_file: str = "invalid_emails.csv"
+    skipped_emails_file: str = "skipped_emails.csv"
     # Hybrid workflow statistics
     hybrid_workflow: HybridWorkflowProcessingStats = field(
         default_factory=HybridWorkflowProcessingStats
@@ -245,6 +252,9 @@ class StreamingProcessor:
         "has_url": "urls",
     }
 
+    # Distinct emails whose classification is reused within one process() run
+    CLASSIFY_CACHE_SIZE = 4096
+
     def __init__(
         self,
         classifier: EmailClassifier | HybridClassifier | None = None,
@@ -254,6 +264,7 @@ class StreamingProcessor:
         strict_validation: bool = False,
         max_body_length: int | None = None,
         use_hybrid: bool = False,
+        compress_side_files: bool = False,
     ) -> None:
         self.classifier: EmailClassifier | HybridClassifier = (
             classifier or EmailClassifier()
@@ -264,6 +275,7 @@ class StreamingProcessor:
         self.strict_validation = strict_validation
         self.max_body_length = max_body_length
         self.use_hybrid = use_hybrid
+        self.compress_side_files = compress_side_files
         self.validator = EmailValidator()
         self.stats = ProcessingStats()
 
@@ -301,6 +313,26 @@ class StreamingProcessor:
 
         return normalized
 
+    def _classify_row(
+        self,
+        row: dict[str, Any],
+        cache: _ClassifyCache | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Classify a normalized row, reusing the result for repeated emails."""
+        if cache is None:
+            return self.classifier.classify_dict(row)
+
+        key = (row["sender"], row["subject"], row["body"], row["urls"])
+        result = cache.pop(key, None)
+        if result is None:
+            result = self.classifier.classify_dict(row)
+            # Evict the least recently used entry so memory stays bounded
+            if len(cache) >= self.CLASSIFY_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # Re-inserting moves the entry to the most recently used end
+        cache[key] = result
+        return result
+
     def count_rows(self, input_path: Path) -> int:
         """Count total rows in CSV file for progress tracking."""
         count = 0
@@ -439,12 +471,29 @@ class StreamingProcessor:
         output_manager = OutputManager(output_dir, input_fieldnames, include_details)
 
         # Initialize invalid email writer
-        invalid_writer = InvalidEmailWriter(output_dir, input_fieldnames)
+        invalid_writer = InvalidEmailWriter(
+            output_dir, input_fieldnames, compress=self.compress_side_files
+        )
+        self.stats.invalid_emails_file = invalid_writer.filepath.name
 
         # Initialize skipped email writer (only if max_body_length is set)
         skipped_writer = None
         if self.max_body_length is not None:
-            skipped_writer = SkippedEmailWriter(output_dir, input_fieldnames)
+            skipped_writer = SkippedEmailWriter(
+                output_dir, input_fieldnames, compress=self.compress_side_files
+            )
+            self.stats.skipped_emails_file = skipped_writer.filepath.name
+
+        # Without an LLM, classification depends only on sender, subject, body
+        # and urls, so templated mail repeated within this run is classified
+        # once. The cache lives for this call only and its details are only
+        # read below, never handed to callers.
+        classify_cache: _ClassifyCache | None = None
+        if (
+            isinstance(self.classifier, EmailClassifier)
+            and not self.classifier.llm_enabled
+        ):
+            classify_cache = {}
 
         try:
             for idx, email_dict in enumerate(self._stream_emails(input_path)):
@@ -453,30 +502,18 @@ class StreamingProcessor:
                     validation_result = self.validator.validate(email_dict)
 
                     if not validation_result.is_valid:
+                        errors = validation_result.errors
+
                         # Write to invalid emails file
-                        invalid_writer.write(email_dict, validation_result.errors)
+                        invalid_writer.write(email_dict, errors)
 
                         # Update validation stats
-                        for error in validation_result.errors:
-                            if error == "invalid_sender_format":
-                                self.stats.validation_stats.invalid_sender_format += 1
-                            elif error == "invalid_receiver_format":
-                                self.stats.validation_stats.invalid_receiver_format += 1
-                            elif error == "empty_sender":
-                                self.stats.validation_stats.invalid_empty_sender += 1
-                            elif error == "empty_receiver":
-                                self.stats.validation_stats.invalid_empty_receiver += 1
-                            elif error == "empty_subject":
-                                self.stats.validation_stats.invalid_empty_subject += 1
-                            elif error == "empty_body":
-                                self.stats.validation_stats.invalid_empty_body += 1
-
-                        self.stats.validation_stats.total_invalid += 1
+                        self.stats.validation_stats.record(errors)
 
                         # In strict mode, raise an error
                         if self.strict_validation:
                             raise ValueError(
-                                f"Validation failed for email {idx + 1}: {validation_result.errors}"
+                                f"Validation failed for email {idx + 1}: {errors}"
                             )
 
                         # Skip to next email
@@ -515,7 +552,9 @@ class StreamingProcessor:
                             normalized_row, email_idx=idx, total_emails=total_rows
                         )
                     else:
-                        domain, details = self.classifier.classify_dict(normalized_row)
+                        domain, details = self._classify_row(
+                            normalized_row, classify_cache
+                        )
 
                     # Prepare output row with standard columns
                     # Preserve original label from input (do not overwrite with domain)
@@ -6,14 +6,41 @@ and visualizations (ASCII-based for terminal).
 """
 
 import json
+import math
+import textwrap
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .domains import DOMAINS
 from .processor import ProcessingStats
 
+# Section separators for the text report, built once at import
+_DHR = "═" * 80 + "\n"
+_HR = "─" * 80 + "\n"
+
+# Every possible bar for the domain (30 cells) and label (20 cells) charts
+_BARS = tuple("█" * i + "░" * (30 - i) for i in range(31))
+_LABEL_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Domain breakdown row: name, bar, count and share of all emails
+_ROW_FMT = "  {name:<20} {bar} {count:>8,} ({pct:>5.1f}%)\n"
+
+# Word wrapper for numbered recommendations, reused across reports
+_WRAPPER = textwrap.TextWrapper(
+    width=76, initial_indent="  ", subsequent_indent="     ", break_long_words=False
+)
+
 
 @dataclass
 class ReportConfig:
@@ -25,6 +52,31 @@ class ReportConfig:
     include_recommendations: bool = True
 
 
+@dataclass(slots=True)
+class _ReportContext:
+    """Rates derived once from ProcessingStats and shared by report sections."""
+
+    inv_total: float
+    inv_total_pct: float
+    inv_classified: float
+    classification_rate: float
+    error_rate: float
+    unsure_rate: float
+    sorted_items: list[tuple[str, int]]
+    classified_counts: list[int]
+    nonzero_domains: list[str]
+    max_domain: tuple[str, int] | None
+    start_iso: str | None
+    end_iso: str | None
+
+
+@lru_cache(maxsize=None)
+def _display_name(domain: str) -> str:
+    """Return the display name for a domain key, falling back to title case."""
+    domain_info = DOMAINS.get(domain)
+    return domain_info.display_name if domain_info else domain.title()
+
+
 class ClassificationReporter:
     """
     Generates comprehensive classification reports.
@@ -42,16 +94,17 @@ class ClassificationReporter:
         self, stats: ProcessingStats, output_dir: Path, input_file: str | None = None
     ) -> dict[str, Any]:
         """Generate full report from processing statistics."""
+        ctx = self._build_context(stats)
         report: dict[str, Any] = {
             "meta": {
                 "generated_at": datetime.now().isoformat(),
                 "input_file": input_file,
                 "output_directory": str(output_dir),
             },
-            "summary": self._generate_summary(stats),
+            "summary": self._generate_summary(stats, ctx),
             "validation": self._generate_validation_summary(stats),
             "skipped": self._generate_skipped_summary(stats),
-            "domain_breakdown": self._generate_domain_breakdown(stats),
+            "domain_breakdown": self._generate_domain_breakdown(stats, ctx),
             "label_distribution_analysis": self._generate_label_distribution_analysis(
                 stats
             ),
@@ -61,8 +114,8 @@ class ClassificationReporter:
             "cross_tabulation_analysis": self._generate_cross_tabulation_analysis(
                 stats
             ),
-            "timing": self._generate_timing_metrics(stats),
-            "quality_metrics": self._generate_quality_metrics(stats),
+            "timing": self._generate_timing_metrics(stats, ctx),
+            "quality_metrics": self._generate_quality_metrics(stats, ctx),
         }
 
         # Add hybrid workflow stats if available
@@ -70,34 +123,77 @@ class ClassificationReporter:
             report["hybrid_workflow"] = self._generate_hybrid_workflow_stats(stats)
 
         if self.config.include_recommendations:
-            report["recommendations"] = self._generate_recommendations(stats)
+            report["recommendations"] = self._generate_recommendations(stats, ctx)
 
         return report
 
-    def _generate_summary(self, stats: "ProcessingStats") -> dict:
-        """Generate summary statistics."""
-        classification_rate = (
-            stats.total_classified / stats.total_processed * 100
-            if stats.total_processed > 0
-            else 0
-        )
+    def generate_summary_only(self, stats: ProcessingStats) -> dict[str, Any]:
+        """Generate just the summary and timing sections for terminal output.
+
+        Skips the breakdown, distribution and quality analysis, which makes
+        it the cheap path when no report files are written. The result is
+        not a full report and cannot be passed to the save_* methods.
+        """
+        ctx = self._build_context(stats, sort_domains=False)
+        return {
+            "summary": self._generate_summary(stats, ctx),
+            "timing": self._generate_timing_metrics(stats, ctx),
+        }
 
-        error_rate = (
-            stats.errors / stats.total_processed * 100
-            if stats.total_processed > 0
-            else 0
+    def _build_context(
+        self, stats: ProcessingStats, sort_domains: bool = True
+    ) -> _ReportContext:
+        """Compute the rates and domain aggregates shared by report sections once."""
+        inv_total = 1.0 / stats.total_processed if stats.total_processed > 0 else 0.0
+        inv_total_pct = inv_total * 100
+
+        # Single walk over domain_counts for every aggregate the sections need
+        counts = stats.domain_counts
+        classified_counts: list[int] = []
+        nonzero_domains: list[str] = []
+        classified_total = 0
+        for domain, count in counts.items():
+            if domain != "unsure":
+                classified_counts.append(count)
+                classified_total += count
+                if count > 0:
+                    nonzero_domains.append(domain)
+
+        # A bound dict method keeps the key function in C, unlike a lambda
+        max_domain: tuple[str, int] | None = None
+        if counts:
+            max_key = max(counts, key=counts.__getitem__)
+            max_domain = (max_key, counts[max_key])
+
+        return _ReportContext(
+            inv_total=inv_total,
+            inv_total_pct=inv_total_pct,
+            inv_classified=1.0 / classified_total if classified_total > 0 else 0.0,
+            classification_rate=stats.total_classified * inv_total_pct,
+            error_rate=stats.errors * inv_total_pct,
+            unsure_rate=stats.total_unsure * inv_total_pct,
+            sorted_items=(
+                sorted(counts.items(), key=itemgetter(1), reverse=True)
+                if sort_domains
+                else []
+            ),
+            classified_counts=classified_counts,
+            nonzero_domains=nonzero_domains,
+            max_domain=max_domain,
+            start_iso=stats.start_time.isoformat() if stats.start_time else None,
+            end_iso=stats.end_time.isoformat() if stats.end_time else None,
         )
 
+    def _generate_summary(self, stats: ProcessingStats, ctx: _ReportContext) -> dict:
+        """Generate summary statistics."""
         return {
             "total_emails": stats.total_processed,
             "classified": stats.total_classified,
             "unsure": stats.total_unsure,
             "errors": stats.errors,
-            "classification_rate_percent": round(classification_rate, 2),
-            "error_rate_percent": round(error_rate, 2),
-            "unique_domains_found": len(
-                [k for k, v in stats.domain_counts.items() if k != "unsure" and v > 0]
-            ),
+            "classification_rate_percent": round(ctx.classification_rate, 2),
+            "error_rate_percent": round(ctx.error_rate, 2),
+            "unique_domains_found": len(ctx.nonzero_domains),
         }
 
     def _generate_validation_summary(self, stats: ProcessingStats) -> dict:
@@ -120,6 +216,7 @@ class ClassificationReporter:
                 "empty_subject": validation.invalid_empty_subject,
                 "empty_body": validation.invalid_empty_body,
             },
+            "file": stats.invalid_emails_file,
         }
 
     def _generate_skipped_summary(self, stats: ProcessingStats) -> dict:
@@ -141,28 +238,29 @@ class ClassificationReporter:
             "breakdown": {
                 "body_too_long": skipped.skipped_body_too_long,
             },
+            "file": stats.skipped_emails_file,
         }
 
-    def _generate_domain_breakdown(self, stats: ProcessingStats) -> dict:
+    def _generate_domain_breakdown(
+        self, stats: ProcessingStats, ctx: _ReportContext
+    ) -> dict:
         """Generate per-domain statistics."""
-        total = stats.total_processed
-        breakdown = {}
+        pct_scale = ctx.inv_total_pct
 
-        for domain, count in sorted(stats.domain_counts.items(), key=lambda x: -x[1]):
-            percentage = count / total * 100 if total > 0 else 0
-
-            domain_info = DOMAINS.get(domain)
-            display_name = domain_info.display_name if domain_info else domain.title()
-
-            breakdown[domain] = {
+        return {
+            domain: {
                 "count": count,
-                "percentage": round(percentage, 2),
-                "display_name": display_name,
+                "percentage": round(count * pct_scale, 2),
+                "display_name": _display_name(domain),
             }
+            for domain, count in ctx.sorted_items
+            # Zero-count domains add nothing to the report; unsure is always kept
+            if count or domain == "unsure"
+        }
 
-        return breakdown
-
-    def _generate_timing_metrics(self, stats: ProcessingStats) -> dict:
+    def _generate_timing_metrics(
+        self, stats: ProcessingStats, ctx: _ReportContext
+    ) -> dict:
         """Generate timing and performance metrics."""
         if stats.start_time and stats.end_time:
             duration = (stats.end_time - stats.start_time).total_seconds()
@@ -172,13 +270,15 @@ class ClassificationReporter:
             emails_per_second = 0
 
         return {
-            "start_time": stats.start_time.isoformat() if stats.start_time else None,
-            "end_time": stats.end_time.isoformat() if stats.end_time else None,
+            "start_time": ctx.start_iso,
+            "end_time": ctx.end_iso,
             "duration_seconds": round(duration, 2),
             "emails_per_second": round(emails_per_second, 2),
         }
 
-    def _generate_quality_metrics(self, stats: ProcessingStats) -> dict:
+    def _generate_quality_metrics(
+        self, stats: ProcessingStats, ctx: _ReportContext
+    ) -> dict:
         """Generate quality and confidence metrics."""
         # Calculate agreement rate (how often both methods agreed)
         agreed = stats.total_classified
@@ -186,31 +286,25 @@ class ClassificationReporter:
         agreement_rate = agreed / total_attempts * 100 if total_attempts > 0 else 0
 
         # Domain distribution evenness (entropy-based)
-        domain_counts = [v for k, v in stats.domain_counts.items() if k != "unsure"]
-        if domain_counts:
-            total_classified = sum(domain_counts)
-            if total_classified > 0:
-                import math
-
-                probabilities = [c / total_classified for c in domain_counts]
-                entropy = -sum(p * math.log2(p) for p in probabilities if p > 0)
-                max_entropy = (
-                    math.log2(len(domain_counts)) if len(domain_counts) > 1 else 1
-                )
-                evenness = entropy / max_entropy if max_entropy > 0 else 0
-            else:
-                evenness = 0
+        domain_counts = ctx.classified_counts
+        inv_classified = ctx.inv_classified
+        if inv_classified > 0:
+            log2 = math.log2
+
+            # Scale by the reciprocal once and skip empty domains in the same pass
+            entropy = -sum(
+                p * log2(p)
+                for p in (c * inv_classified for c in domain_counts if c > 0)
+            )
+            max_entropy = log2(len(domain_counts)) if len(domain_counts) > 1 else 1
+            evenness = entropy / max_entropy if max_entropy > 0 else 0
         else:
             evenness = 0
 
         return {
             "method_agreement_rate": round(agreement_rate, 2),
             "domain_distribution_evenness": round(evenness, 4),
-            "unsure_rate": (
-                round(stats.total_unsure / stats.total_processed * 100, 2)
-                if stats.total_processed > 0
-                else 0
-            ),
+            "unsure_rate": round(ctx.unsure_rate, 2),
         }
 
     def _generate_hybrid_workflow_stats(self, stats: ProcessingStats) -> dict:
@@ -232,15 +326,13 @@ class ClassificationReporter:
             ),
         }
 
-    def _generate_recommendations(self, stats: ProcessingStats) -> list[str]:
+    def _generate_recommendations(
+        self, stats: ProcessingStats, ctx: _ReportContext
+    ) -> list[str]:
         """Generate actionable recommendations based on results."""
         recommendations = []
 
-        unsure_rate = (
-            stats.total_unsure / stats.total_processed * 100
-            if stats.total_processed > 0
-            else 0
-        )
+        unsure_rate = ctx.unsure_rate
 
         if unsure_rate > 30:
             recommendations.append(
@@ -254,11 +346,7 @@ class ClassificationReporter:
                 "not currently defined in the taxonomy. Review unsure emails for new domain patterns."
             )
 
-        error_rate = (
-            stats.errors / stats.total_processed * 100
-            if stats.total_processed > 0
-            else 0
-        )
+        error_rate = ctx.error_rate
         if error_rate > 5:
             recommendations.append(
                 f"Error rate of {error_rate:.1f}% detected. Check input data quality "
@@ -266,13 +354,9 @@ class ClassificationReporter:
             )
 
         # Check for dominant domains
-        if stats.domain_counts:
-            max_domain = max(stats.domain_counts.items(), key=lambda x: x[1])
-            max_percentage = (
-                max_domain[1] / stats.total_processed * 100
-                if stats.total_processed > 0
-                else 0
-            )
+        max_domain = ctx.max_domain
+        if max_domain is not None:
+            max_percentage = max_domain[1] * ctx.inv_total_pct
 
             if max_percentage > 70 and max_domain[0] != "unsure":
                 recommendations.append(
@@ -301,13 +385,13 @@ class ClassificationReporter:
             if total_in_domain == 0:
                 continue
 
-            distribution = {}
-            for label, count in sorted(label_counts.items(), key=lambda x: -x[1]):
-                percentage = count / total_in_domain * 100
-                distribution[label] = {
-                    "count": count,
-                    "percentage": round(percentage, 2),
-                }
+            scale = 100.0 / total_in_domain
+            distribution = {
+                label: {"count": count, "percentage": round(count * scale, 2)}
+                for label, count in sorted(
+                    label_counts.items(), key=itemgetter(1), reverse=True
+                )
+            }
 
             analysis[domain] = {
                 "total_emails": total_in_domain,
@@ -396,283 +480,283 @@ class ClassificationReporter:
         return analysis
 
     def save_json_report(self, report: dict, output_path: Path) -> None:
-        """Save report as JSON file."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
+        """Save report as JSON file.
+
+        Uses orjson when installed (``pip install .[speedups]``), otherwise
+        falls back to the standard library encoder with the same layout.
+        """
+        if ORJSON_AVAILABLE:
+            with open(output_path, "wb") as fb:
+                fb.write(
+                    orjson.dumps(
+                        report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
 
     def save_text_report(self, report: dict, output_path: Path) -> None:
         """Save report as formatted text with ASCII visualization."""
-        lines = []
-
-        # Header
-        lines.append("═" * 80)
-        lines.append("                    EMAIL CLASSIFICATION REPORT")
-        lines.append("═" * 80)
-        lines.append("")
-
-        # Meta info
-        lines.append(f"Generated: {report['meta']['generated_at']}")
-        if report["meta"]["input_file"]:
-            lines.append(f"Input: {report['meta']['input_file']}")
-        lines.append(f"Output: {report['meta']['output_directory']}")
-        lines.append("")
-
-        # Summary section
-        lines.append("─" * 80)
-        lines.append("  SUMMARY")
-        lines.append("─" * 80)
-        summary = report["summary"]
-        lines.append(f"  Total Emails Processed:  {summary['total_emails']:,}")
-        lines.append(
-            f"  Successfully Classified: {summary['classified']:,} ({summary['classification_rate_percent']}%)"
-        )
-        lines.append(f"  Unsure/Unclassified:     {summary['unsure']:,}")
-        lines.append(
-            f"  Errors:                  {summary['errors']:,} ({summary['error_rate_percent']}%)"
-        )
-        lines.append(f"  Unique Domains Found:    {summary['unique_domains_found']}")
-        lines.append("")
-
-        # Validation section
-        if report.get("validation") and report["validation"]["total_invalid"] > 0:
-            lines.append("─" * 80)
-            lines.append("  DATA VALIDATION")
-            lines.append("─" * 80)
-            validation = report["validation"]
-            lines.append(
-                f"  Invalid Emails Skipped:  {validation['total_invalid']:,} ({validation['invalid_percentage']}%)"
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            write = f.write
+
+            # Header
+            write(_DHR)
+            write("                    EMAIL CLASSIFICATION REPORT\n")
+            write(_DHR)
+            write("\n")
+
+            # Meta info
+            write(f"Generated: {report['meta']['generated_at']}\n")
+            if report["meta"]["input_file"]:
+                write(f"Input: {report['meta']['input_file']}\n")
+            write(f"Output: {report['meta']['output_directory']}\n")
+            write("\n")
+
+            # Summary section
+            write(_HR)
+            write("  SUMMARY\n")
+            write(_HR)
+            summary = report["summary"]
+            write(f"  Total Emails Processed:  {summary['total_emails']:,}\n")
+            write(
+                f"  Successfully Classified: {summary['classified']:,} ({summary['classification_rate_percent']}%)\n"
             )
-            lines.append("  Validation Errors Breakdown:")
-            breakdown = validation["breakdown"]
-            if breakdown["invalid_sender_format"] > 0:
-                lines.append(
-                    f"    - Invalid sender format:   {breakdown['invalid_sender_format']:,}"
-                )
-            if breakdown["invalid_receiver_format"] > 0:
-                lines.append(
-                    f"    - Invalid receiver format: {breakdown['invalid_receiver_format']:,}"
-                )
-            if breakdown["empty_sender"] > 0:
-                lines.append(
-                    f"    - Empty sender:            {breakdown['empty_sender']:,}"
-                )
-            if breakdown["empty_receiver"] > 0:
-                lines.append(
-                    f"    - Empty receiver:          {breakdown['empty_receiver']:,}"
-                )
-            if breakdown["empty_subject"] > 0:
-                lines.append(
-                    f"    - Empty subject:           {breakdown['empty_subject']:,}"
-                )
-            if breakdown["empty_body"] > 0:
-                lines.append(
-                    f"    - Empty body:              {breakdown['empty_body']:,}"
-                )
-            lines.append("  (See invalid_emails.csv for details)")
-            lines.append("")
-
-        # Skipped emails section
-        if report.get("skipped") and report["skipped"]["total_skipped"] > 0:
-            lines.append("─" * 80)
-            lines.append("  SKIPPED EMAILS")
-            lines.append("─" * 80)
-            skipped = report["skipped"]
-            lines.append(
-                f"  Total Skipped:           {skipped['total_skipped']:,} ({skipped['skipped_percentage']}%)"
+            write(f"  Unsure/Unclassified:     {summary['unsure']:,}\n")
+            write(
+                f"  Errors:                  {summary['errors']:,} ({summary['error_rate_percent']}%)\n"
             )
-            lines.append("  Skip Reasons Breakdown:")
-            breakdown = skipped["breakdown"]
-            if breakdown["body_too_long"] > 0:
-                lines.append(
-                    f"    - Body too long:           {breakdown['body_too_long']:,}"
+            write(f"  Unique Domains Found:    {summary['unique_domains_found']}\n")
+            write("\n")
+
+            # Validation section
+            if report.get("validation") and report["validation"]["total_invalid"] > 0:
+                write(_HR)
+                write("  DATA VALIDATION\n")
+                write(_HR)
+                validation = report["validation"]
+                write(
+                    f"  Invalid Emails Skipped:  {validation['total_invalid']:,} ({validation['invalid_percentage']}%)\n"
                 )
-            lines.append("  (See skipped_emails.csv for details)")
-            lines.append("")
-
-        # Hybrid workflow section
-        if report.get("hybrid_workflow"):
-            lines.append("─" * 80)
-            lines.append("  HYBRID WORKFLOW STATISTICS")
-            lines.append("─" * 80)
-            hybrid = report["hybrid_workflow"]
-            lines.append(f"  Total Processed (Hybrid): {hybrid['total_processed']:,}")
-            lines.append(
-                f"  Classic Agreement Count:  {hybrid['classic_agreement_count']:,}"
-            )
-            lines.append(f"  Agreement Rate:           {hybrid['agreement_rate']}%")
-            lines.append(f"  LLM Calls Made:           {hybrid['llm_call_count']:,}")
-            lines.append(
-                f"  LLM Savings:              {hybrid['llm_savings_percent']}%"
-            )
-            if hybrid["llm_call_count"] > 0:
-                lines.append(
-                    f"  LLM Total Time:           {hybrid['llm_total_time_ms']:.0f}ms"
+                write("  Validation Errors Breakdown:\n")
+                breakdown = validation["breakdown"]
+                if breakdown["invalid_sender_format"] > 0:
+                    write(
+                        f"    - Invalid sender format:   {breakdown['invalid_sender_format']:,}\n"
+                    )
+                if breakdown["invalid_receiver_format"] > 0:
+                    write(
+                        f"    - Invalid receiver format: {breakdown['invalid_receiver_format']:,}\n"
+                    )
+                if breakdown["empty_sender"] > 0:
+                    write(
+                        f"    - Empty sender:            {breakdown['empty_sender']:,}\n"
+                    )
+                if breakdown["empty_receiver"] > 0:
+                    write(
+                        f"    - Empty receiver:          {breakdown['empty_receiver']:,}\n"
+                    )
+                if breakdown["empty_subject"] > 0:
+                    write(
+                        f"    - Empty subject:           {breakdown['empty_subject']:,}\n"
+                    )
+                if breakdown["empty_body"] > 0:
+                    write(
+                        f"    - Empty body:              {breakdown['empty_body']:,}\n"
+                    )
+                write(
+                    f"  (See {validation.get('file', 'invalid_emails.csv')} for details)\n"
                 )
-                lines.append(
-                    f"  LLM Avg Response Time:    {hybrid['llm_avg_time_ms']:.0f}ms"
+                write("\n")
+
+            # Skipped emails section
+            if report.get("skipped") and report["skipped"]["total_skipped"] > 0:
+                write(_HR)
+                write("  SKIPPED EMAILS\n")
+                write(_HR)
+                skipped = report["skipped"]
+                write(
+                    f"  Total Skipped:           {skipped['total_skipped']:,} ({skipped['skipped_percentage']}%)\n"
                 )
-            lines.append("")
-
-        # Domain breakdown with bar chart
-        lines.append("─" * 80)
-        lines.append("  DOMAIN BREAKDOWN")
-        lines.append("─" * 80)
-
-        breakdown = report["domain_breakdown"]
-        max_count = max(d["count"] for d in breakdown.values()) if breakdown else 1
-
-        for domain, data in breakdown.items():
-            bar_length = int(data["count"] / max_count * 30) if max_count > 0 else 0
-            bar = "█" * bar_length + "░" * (30 - bar_length)
-            lines.append(
-                f"  {data['display_name']:<20} {bar} {data['count']:>8,} ({data['percentage']:>5.1f}%)"
-            )
-        lines.append("")
-
-        # Label distribution analysis
-        if report.get("label_distribution_analysis"):
-            lines.append("─" * 80)
-            lines.append("  LABEL DISTRIBUTION ANALYSIS")
-            lines.append("─" * 80)
-
-            label_analysis = report["label_distribution_analysis"]
-            for domain, data in label_analysis.items():
-                domain_info = DOMAINS.get(domain)
-                display_name = (
-                    domain_info.display_name if domain_info else domain.title()
+                write("  Skip Reasons Breakdown:\n")
+                breakdown = skipped["breakdown"]
+                if breakdown["body_too_long"] > 0:
+                    write(
+                        f"    - Body too long:           {breakdown['body_too_long']:,}\n"
+                    )
+                write(
+                    f"  (See {skipped.get('file', 'skipped_emails.csv')} for details)\n"
                 )
-
-                lines.append(
-                    f"  {display_name} ({data['total_emails']} emails, {data['unique_labels']} labels):"
+                write("\n")
+
+            # Hybrid workflow section
+            if report.get("hybrid_workflow"):
+                write(_HR)
+                write("  HYBRID WORKFLOW STATISTICS\n")
+                write(_HR)
+                hybrid = report["hybrid_workflow"]
+                write(f"  Total Processed (Hybrid): {hybrid['total_processed']:,}\n")
+                write(
+                    f"  Classic Agreement Count:  {hybrid['classic_agreement_count']:,}\n"
                 )
-
-                # Show top 5 labels for this domain
-                sorted_labels = sorted(
-                    data["distribution"].items(), key=lambda x: -x[1]["percentage"]
-                )[:5]
-                for label, label_data in sorted_labels:
-                    bar_length = int(label_data["percentage"] / 100 * 20)
-                    bar = "█" * bar_length + "░" * (20 - bar_length)
-                    label_str = str(label) if label is not None else "(none)"
-                    lines.append(
-                        f"    {label_str:<15} {bar} {label_data['count']:>6,} ({label_data['percentage']:>5.1f}%)"
+                write(f"  Agreement Rate:           {hybrid['agreement_rate']}%\n")
+                write(f"  LLM Calls Made:           {hybrid['llm_call_count']:,}\n")
+                write(f"  LLM Savings:              {hybrid['llm_savings_percent']}%\n")
+                if hybrid["llm_call_count"] > 0:
+                    write(
+                        f"  LLM Total Time:           {hybrid['llm_total_time_ms']:.0f}ms\n"
                     )
-
-                if len(data["distribution"]) > 5:
-                    lines.append(
-                        f"    ... and {len(data['distribution']) - 5} more labels"
+                    write(
+                        f"  LLM Avg Response Time:    {hybrid['llm_avg_time_ms']:.0f}ms\n"
+                    )
+                write("\n")
+
+            # Domain breakdown with bar chart
+            write(_HR)
+            write("  DOMAIN BREAKDOWN\n")
+            write(_HR)
+
+            breakdown = report["domain_breakdown"]
+            max_count = max(d["count"] for d in breakdown.values()) if breakdown else 1
+
+            row_fmt = _ROW_FMT.format
+            for domain, data in breakdown.items():
+                bar_length = int(data["count"] / max_count * 30) if max_count > 0 else 0
+                write(
+                    row_fmt(
+                        name=data["display_name"],
+                        bar=_BARS[bar_length],
+                        count=data["count"],
+                        pct=data["percentage"],
                     )
-                lines.append("")
-
-        # URL distribution analysis
-        if report.get("url_distribution_analysis"):
-            lines.append("─" * 80)
-            lines.append("  URL PRESENCE ANALYSIS")
-            lines.append("─" * 80)
-
-            url_analysis = report["url_distribution_analysis"]
-            for domain, data in url_analysis.items():
-                domain_info = DOMAINS.get(domain)
-                display_name = (
-                    domain_info.display_name if domain_info else domain.title()
                 )
+            write("\n")
 
-                with_urls = data["with_urls"]
-                without_urls = data["without_urls"]
+            # Label distribution analysis
+            if report.get("label_distribution_analysis"):
+                write(_HR)
+                write("  LABEL DISTRIBUTION ANALYSIS\n")
+                write(_HR)
 
-                lines.append(f"  {display_name}:")
-                lines.append(
-                    f"    With URLs:    {with_urls['count']:>6,} ({with_urls['percentage']:>5.1f}%)"
-                )
-                lines.append(
-                    f"    Without URLs: {without_urls['count']:>6,} ({without_urls['percentage']:>5.1f}%)"
-                )
-                lines.append("")
-
-        # Cross-tabulation analysis (compact format)
-        if report.get("cross_tabulation_analysis"):
-            lines.append("─" * 80)
-            lines.append("  CROSS-TABULATION INSIGHTS")
-            lines.append("─" * 80)
-
-            cross_analysis = report["cross_tabulation_analysis"]
-            for domain, data in cross_analysis.items():
-                domain_info = DOMAINS.get(domain)
-                display_name = (
-                    domain_info.display_name if domain_info else domain.title()
-                )
+                label_analysis = report["label_distribution_analysis"]
+                for domain, data in label_analysis.items():
+                    display_name = _display_name(domain)
 
-                lines.append(f"  {display_name} ({data['total_emails']} emails):")
-
-                # Show top 3 labels by domain percentage
-                sorted_labels = sorted(
-                    data["labels"].items(), key=lambda x: -x[1]["percentage_of_domain"]
-                )[:3]
-                for label, label_data in sorted_labels:
-                    with_pct = label_data["with_urls_percentage"]
-                    without_pct = label_data["without_urls_percentage"]
-                    label_str = str(label) if label is not None else "(none)"
-                    lines.append(
-                        f"    {label_str:<12}: {label_data['total']:>4,} ({label_data['percentage_of_domain']:>5.1f}%) [URLs: {with_pct:>4.1f}%]"
+                    write(
+                        f"  {display_name} ({data['total_emails']} emails, {data['unique_labels']} labels):\n"
                     )
 
-                if len(data["labels"]) > 3:
-                    lines.append(
-                        f"    ... and {len(data['labels']) - 3} more label patterns"
+                    # Show top 5 labels for this domain
+                    sorted_labels = sorted(
+                        data["distribution"].items(), key=lambda x: -x[1]["percentage"]
+                    )[:5]
+                    for label, label_data in sorted_labels:
+                        bar_length = int(label_data["percentage"] / 100 * 20)
+                        bar = _LABEL_BARS[bar_length]
+                        label_str = str(label) if label is not None else "(none)"
+                        write(
+                            f"    {label_str:<15} {bar} {label_data['count']:>6,} ({label_data['percentage']:>5.1f}%)\n"
+                        )
+
+                    if len(data["distribution"]) > 5:
+                        write(
+                            f"    ... and {len(data['distribution']) - 5} more labels\n"
+                        )
+                    write("\n")
+
+            # URL distribution analysis
+            if report.get("url_distribution_analysis"):
+                write(_HR)
+                write("  URL PRESENCE ANALYSIS\n")
+                write(_HR)
+
+                url_analysis = report["url_distribution_analysis"]
+                for domain, data in url_analysis.items():
+                    display_name = _display_name(domain)
+
+                    with_urls = data["with_urls"]
+                    without_urls = data["without_urls"]
+
+                    write(f"  {display_name}:\n")
+                    write(
+                        f"    With URLs:    {with_urls['count']:>6,} ({with_urls['percentage']:>5.1f}%)\n"
                     )
-                lines.append("")
-
-        # Timing metrics
-        lines.append("─" * 80)
-        lines.append("  PERFORMANCE METRICS")
-        lines.append("─" * 80)
-        timing = report["timing"]
-        lines.append(f"  Duration:            {timing['duration_seconds']:.2f} seconds")
-        lines.append(
-            f"  Processing Speed:    {timing['emails_per_second']:.2f} emails/second"
-        )
-        lines.append("")
-
-        # Quality metrics
-        lines.append("─" * 80)
-        lines.append("  QUALITY METRICS")
-        lines.append("─" * 80)
-        quality = report["quality_metrics"]
-        lines.append(
-            f"  Method Agreement Rate:      {quality['method_agreement_rate']}%"
-        )
-        lines.append(f"  Unsure Rate:                {quality['unsure_rate']}%")
-        lines.append(
-            f"  Domain Distribution Score:  {quality['domain_distribution_evenness']:.4f}"
-        )
-        lines.append("")
-
-        # Recommendations
-        if "recommendations" in report:
-            lines.append("─" * 80)
-            lines.append("  RECOMMENDATIONS")
-            lines.append("─" * 80)
-            for i, rec in enumerate(report["recommendations"], 1):
-                # Word wrap recommendations
-                words = rec.split()
-                current_line = f"  {i}. "
-                for word in words:
-                    if len(current_line) + len(word) > 76:
-                        lines.append(current_line)
-                        current_line = "     " + word + " "
-                    else:
-                        current_line += word + " "
-                if current_line.strip():
-                    lines.append(current_line)
-            lines.append("")
-
-        # Footer
-        lines.append("═" * 80)
-        lines.append("                         END OF REPORT")
-        lines.append("═" * 80)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+                    write(
+                        f"    Without URLs: {without_urls['count']:>6,} ({without_urls['percentage']:>5.1f}%)\n"
+                    )
+                    write("\n")
+
+            # Cross-tabulation analysis (compact format)
+            if report.get("cross_tabulation_analysis"):
+                write(_HR)
+                write("  CROSS-TABULATION INSIGHTS\n")
+                write(_HR)
+
+                cross_analysis = report["cross_tabulation_analysis"]
+                for domain, data in cross_analysis.items():
+                    display_name = _display_name(domain)
+
+                    write(f"  {display_name} ({data['total_emails']} emails):\n")
+
+                    # Show top 3 labels by domain percentage
+                    sorted_labels = sorted(
+                        data["labels"].items(),
+                        key=lambda x: -x[1]["percentage_of_domain"],
+                    )[:3]
+                    for label, label_data in sorted_labels:
+                        with_pct = label_data["with_urls_percentage"]
+                        without_pct = label_data["without_urls_percentage"]
+                        label_str = str(label) if label is not None else "(none)"
+                        write(
+                            f"    {label_str:<12}: {label_data['total']:>4,} ({label_data['percentage_of_domain']:>5.1f}%) [URLs: {with_pct:>4.1f}%]\n"
+                        )
+
+                    if len(data["labels"]) > 3:
+                        write(
+                            f"    ... and {len(data['labels']) - 3} more label patterns\n"
+                        )
+                    write("\n")
+
+            # Timing metrics
+            write(_HR)
+            write("  PERFORMANCE METRICS\n")
+            write(_HR)
+            timing = report["timing"]
+            write(f"  Duration:            {timing['duration_seconds']:.2f} seconds\n")
+            write(
+                f"  Processing Speed:    {timing['emails_per_second']:.2f} emails/second\n"
+            )
+            write("\n")
+
+            # Quality metrics
+            write(_HR)
+            write("  QUALITY METRICS\n")
+            write(_HR)
+            quality = report["quality_metrics"]
+            write(
+                f"  Method Agreement Rate:      {quality['method_agreement_rate']}%\n"
+            )
+            write(f"  Unsure Rate:                {quality['unsure_rate']}%\n")
+            write(
+                f"  Domain Distribution Score:  {quality['domain_distribution_evenness']:.4f}\n"
+            )
+            write("\n")
+
+            # Recommendations
+            if "recommendations" in report:
+                write(_HR)
+                write("  RECOMMENDATIONS\n")
+                write(_HR)
+                for i, rec in enumerate(report["recommendations"], 1):
+                    write(_WRAPPER.fill(f"{i}. {rec}"))
+                    write("\n")
+                write("\n")
+
+            # Footer
+            write(_DHR)
+            write("                         END OF REPORT\n")
+            write(_DHR)
 
     def format_terminal_summary(self, report: dict) -> str:
         """Format a brief summary for terminal output."""
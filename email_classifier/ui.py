@@ -7,63 +7,171 @@ the Rich library for beautiful terminal output.
 
 from __future__ import annotations
 
+import heapq
+import importlib.util
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, ProgressColumn
+    from rich.style import Style
+    from rich.theme import Theme
+
     from .analyzer import AnalysisResult
 
-try:
-    from rich import box
+# Rich is imported on first use inside TerminalUI, so quiet runs and the
+# SimpleUI fallback never pay its import cost
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+
+
+# Custom theme styles for distinctive look
+CLASSIFIER_STYLES = {
+    "info": "cyan",
+    "warning": "yellow",
+    "error": "bold red",
+    "success": "bold green",
+    "domain.finance": "green",
+    "domain.technology": "blue",
+    "domain.retail": "magenta",
+    "domain.logistics": "yellow",
+    "domain.healthcare": "cyan",
+    "domain.government": "red",
+    "domain.hr": "white",
+    "domain.telecommunications": "bright_blue",
+    "domain.social_media": "bright_magenta",
+    "domain.education": "bright_cyan",
+    "domain.unsure": "dim white",
+    "header": "bold bright_white on dark_blue",
+    "accent": "bold cyan",
+}
+
+# Domains with a dedicated ``domain.<name>`` theme style
+KNOWN_DOMAINS: frozenset[str] = frozenset(
+    (
+        "finance",
+        "technology",
+        "retail",
+        "logistics",
+        "healthcare",
+        "government",
+        "hr",
+        "telecommunications",
+        "social_media",
+        "education",
+        "unsure",
+    )
+)
+_STYLE_CACHE = {domain: f"domain.{domain}" for domain in KNOWN_DOMAINS}
+_DISPLAY_NAME = {
+    domain: ("⚠️  Unsure" if domain == "unsure" else domain.replace("_", " ").title())
+    for domain in KNOWN_DOMAINS
+}
+
+
+def _domain_style(domain: str) -> str:
+    """Return the theme style for a domain, or plain white if it has none."""
+    return _STYLE_CACHE.get(domain, "white")
+
+
+# Accepted answers for confirm()
+_YES = frozenset(("y", "yes"))
+
+# Bound formatters for the count and percentage table cells
+_format_int = "{:,}".format
+_format_pct = "{:.1f}%".format
+
+# Bar templates; bars of any width up to 64 are sliced from these
+_BAR_FULL = "█" * 64
+_BAR_EMPTY = "░" * 64
+
+# Precomputed distribution bars, indexed by filled width
+_BARS_15 = tuple(_BAR_FULL[:i] + _BAR_EMPTY[: 15 - i] for i in range(16))
+_BARS_25 = tuple(_BAR_FULL[:i] for i in range(26))
+
+
+@lru_cache(maxsize=1)
+def _get_theme() -> Theme:
+    """Return the Rich theme built from CLASSIFIER_STYLES."""
+    from rich.theme import Theme
+
+    return Theme(CLASSIFIER_STYLES)
+
+
+@lru_cache(maxsize=None)
+def _border_style(name: str) -> Style:
+    """Return a parsed border Style, shared by every table and panel."""
+    from rich.style import Style
+
+    return Style.parse(name)
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared themed console used by every TerminalUI."""
     from rich.console import Console
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.panel import Panel
+
+    return Console(theme=_get_theme())
+
+
+@lru_cache(maxsize=1)
+def _progress_columns() -> tuple[ProgressColumn, ...]:
+    """Return the progress columns, shared as stateless render templates."""
     from rich.progress import (
         BarColumn,
-        Progress,
         SpinnerColumn,
         TaskProgressColumn,
         TextColumn,
         TimeElapsedColumn,
         TimeRemainingColumn,
     )
-    from rich.status import Status
-    from rich.style import Style
-    from rich.table import Table
-    from rich.text import Text
-    from rich.theme import Theme
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    Status = None  # type: ignore
-
-
-# Custom theme for distinctive look
-CLASSIFIER_THEME = Theme(
-    {
-        "info": "cyan",
-        "warning": "yellow",
-        "error": "bold red",
-        "success": "bold green",
-        "domain.finance": "green",
-        "domain.technology": "blue",
-        "domain.retail": "magenta",
-        "domain.logistics": "yellow",
-        "domain.healthcare": "cyan",
-        "domain.government": "red",
-        "domain.hr": "white",
-        "domain.telecommunications": "bright_blue",
-        "domain.social_media": "bright_magenta",
-        "domain.education": "bright_cyan",
-        "domain.unsure": "dim white",
-        "header": "bold bright_white on dark_blue",
-        "accent": "bold cyan",
-    }
-)
+    return (
+        SpinnerColumn(spinner_name="dots12", style="cyan"),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40, style="cyan", complete_style="green"),
+        TaskProgressColumn(),
+        TextColumn("•"),
+        TimeElapsedColumn(),
+        TextColumn("•"),
+        TimeRemainingColumn(),
+    )
+
+
+_BANNER = """
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║   ███████╗███╗   ███╗ █████╗ ██╗██╗         ██████╗██╗      █████╗ ███████╗   ║
+║   ██╔════╝████╗ ████║██╔══██╗██║██║        ██╔════╝██║     ██╔══██╗██╔════╝   ║
+║   █████╗  ██╔████╔██║███████║██║██║        ██║     ██║     ███████║███████╗   ║
+║   ██╔══╝  ██║╚██╔╝██║██╔══██║██║██║        ██║     ██║     ██╔══██║╚════██║   ║
+║   ███████╗██║ ╚═╝ ██║██║  ██║██║███████╗   ╚██████╗███████╗██║  ██║███████║   ║
+║   ╚══════╝╚═╝     ╚═╝╚═╝  ╚═╝╚═╝╚══════╝    ╚═════╝╚══════╝╚═╝  ╚═╝╚══════╝   ║
+║                                                                               ║
+║                    Domain Classification System v1.0                          ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+
+# The banner has one uniform style, so modern terminals get it with a single
+# ANSI prefix/suffix instead of going through Rich's segment rendering
+_BANNER_ANSI = f"\x1b[1;36m{_BANNER}\x1b[0m\n"
+
+# Colour systems that understand the raw escape sequence in _BANNER_ANSI
+_ANSI_BANNER_COLOR_SYSTEMS = frozenset({"truecolor", "256"})
+
+
+def __getattr__(name: str) -> Any:
+    # CLASSIFIER_THEME is built on first access to keep Rich out of import time
+    if name == "CLASSIFIER_THEME":
+        return _get_theme()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class StatusBar:
@@ -128,7 +236,77 @@ class StatusBar:
             print()  # New line after status updates
 
 
-class TerminalUI:
+class BaseUI:
+    """
+    Common interface shared by every UI implementation.
+
+    Renders nothing by default, so subclasses override only the output
+    they support and callers can use any UI without hasattr checks.
+    """
+
+    def __init__(self, quiet: bool = False) -> None:
+        self.quiet = quiet
+
+    def print_banner(self) -> None:
+        """Display application banner."""
+
+    def print_config(
+        self, input_file: str, output_dir: str, options: dict[str, Any] | None = None
+    ) -> None:
+        """Display configuration."""
+
+    def create_status_bar(self) -> StatusBar:
+        """Create a status bar for real-time updates."""
+        return StatusBar(console=None, quiet=self.quiet)
+
+    def create_progress(self) -> Progress | None:
+        """Create progress bar context manager, if supported."""
+        return None
+
+    def print_progress(self, current: int, total: int, status: str = "") -> None:
+        """Display a progress update for UIs without a live progress bar."""
+
+    def print_domain_stats(
+        self,
+        domain_counts: dict[str, int],
+        total: int,
+        enhanced_stats: dict[str, Any] | None = None,
+        input_file: str | None = None,
+    ) -> None:
+        """Display domain statistics."""
+
+    def print_summary_panel(self, stats: dict[str, Any]) -> None:
+        """Display final summary."""
+
+    def print_output_files(self, output_dir: Path, file_counts: dict[str, int]) -> None:
+        """Display list of output files created."""
+
+    def print_recommendations(self, recommendations: list[str]) -> None:
+        """Display recommendations."""
+
+    def print_analysis_report(self, result: AnalysisResult) -> None:
+        """Display dataset analysis report."""
+
+    def print_error(self, message: str) -> None:
+        print(f"ERROR: {message}", file=sys.stderr)
+
+    def print_warning(self, message: str) -> None:
+        print(f"WARNING: {message}", file=sys.stderr)
+
+    def print_success(self, message: str) -> None:
+        print(f"✓ {message}")
+
+    def print_info(self, message: str) -> None:
+        if not self.quiet:
+            print(f"ℹ {message}")
+
+    def confirm(self, message: str) -> bool:
+        """Ask for user confirmation."""
+        print(f"\n? {message} (y/n) ", end="")
+        return input().strip().lower() in _YES
+
+
+class TerminalUI(BaseUI):
     """
     Rich terminal UI for email classification.
 
@@ -140,42 +318,60 @@ class TerminalUI:
     """
 
     def __init__(self, quiet: bool = False) -> None:
-        self.quiet = quiet
+        super().__init__(quiet)
 
         if RICH_AVAILABLE and not quiet:
-            self.console: Console | None = Console(theme=CLASSIFIER_THEME)
+            self.console: Console | None = _get_console()
         else:
             self.console = None
+        self._enabled = self.console is not None and not quiet
+        # Redirected output (CI logs, nohup, pipes) gets the plain renderer
+        self._plain: SimpleUI | None = None
+        if self.console is not None and not self.console.is_terminal:
+            self._plain = SimpleUI(quiet)
 
     def print_banner(self) -> None:
         """Display application banner."""
-        if self.quiet or not self.console:
+        if not self._enabled:
+            return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_banner()
             return
 
-        banner = """
-╔═══════════════════════════════════════════════════════════════════════════════╗
-║                                                                               ║
-║   ███████╗███╗   ███╗ █████╗ ██╗██╗         ██████╗██╗      █████╗ ███████╗   ║
-║   ██╔════╝████╗ ████║██╔══██╗██║██║        ██╔════╝██║     ██╔══██╗██╔════╝   ║
-║   █████╗  ██╔████╔██║███████║██║██║        ██║     ██║     ███████║███████╗   ║
-║   ██╔══╝  ██║╚██╔╝██║██╔══██║██║██║        ██║     ██║     ██╔══██║╚════██║   ║
-║   ███████╗██║ ╚═╝ ██║██║  ██║██║███████╗   ╚██████╗███████╗██║  ██║███████║   ║
-║   ╚══════╝╚═╝     ╚═╝╚═╝  ╚═╝╚═╝╚══════╝    ╚═════╝╚══════╝╚═╝  ╚═╝╚══════╝   ║
-║                                                                               ║
-║                    Domain Classification System v1.0                          ║
-║                                                                               ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
-"""
-        self.console.print(banner, style="bold cyan")
+        console = self.console
+        if (
+            console.color_system in _ANSI_BANNER_COLOR_SYSTEMS
+            and not console.no_color
+            # Recorded or captured output only sees what goes through print()
+            and not console.record
+            and not console._buffer_index
+        ):
+            console.file.write(_BANNER_ANSI)
+            console.file.flush()
+        else:
+            # Legacy Windows, NO_COLOR and basic terminals: let Rich render it
+            console.print(_BANNER, style="bold cyan")
 
     def print_config(
         self, input_file: str, output_dir: str, options: dict[str, Any] | None = None
     ) -> None:
         """Display configuration panel."""
-        if self.quiet or not self.console:
+        if not self._enabled:
             return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_config(input_file, output_dir, options)
+            return
+
+        from rich import box
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
 
-        table = Table(show_header=False, box=box.ROUNDED, border_style="cyan")
+        table = Table(
+            show_header=False, box=box.ROUNDED, border_style=_border_style("cyan")
+        )
         table.add_column("Setting", style="bold")
         table.add_column("Value", style="white")
 
@@ -190,12 +386,11 @@ class TerminalUI:
         panel = Panel(
             table,
             title="[bold]Configuration[/bold]",
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             padding=(1, 2),
         )
 
-        self.console.print(panel)
-        self.console.print()
+        self.console.print(Group(panel, ""))
 
     def create_status_bar(self) -> StatusBar:
         """Create a status bar for real-time updates.
@@ -207,20 +402,18 @@ class TerminalUI:
 
     def create_progress(self) -> Progress | None:
         """Create progress bar context manager."""
-        if self.quiet or not self.console:
+        if not self._enabled:
             return None
 
+        from rich.progress import Progress
+
         return Progress(
-            SpinnerColumn(spinner_name="dots12", style="cyan"),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40, style="cyan", complete_style="green"),
-            TaskProgressColumn(),
-            TextColumn("•"),
-            TimeElapsedColumn(),
-            TextColumn("•"),
-            TimeRemainingColumn(),
+            *_progress_columns(),
             console=self.console,
             expand=True,
+            refresh_per_second=4,
+            auto_refresh=True,
+            transient=False,
         )
 
     def print_domain_stats(
@@ -231,13 +424,24 @@ class TerminalUI:
         input_file: str | None = None,
     ) -> None:
         """Display domain statistics table."""
-        if self.quiet or not self.console:
+        if not self._enabled:
+            return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_domain_stats(
+                domain_counts, total, enhanced_stats, input_file
+            )
             return
 
+        from rich import box
+        from rich.console import Group
+        from rich.markup import escape
+        from rich.table import Table
+
         table = Table(
             title="Classification Results by Domain",
             box=box.DOUBLE_EDGE,
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             header_style="bold white on dark_blue",
             show_lines=True,
         )
@@ -248,48 +452,39 @@ class TerminalUI:
         table.add_column("Distribution", width=30)
 
         # Sort by count descending
-        sorted_domains = sorted(domain_counts.items(), key=lambda x: -x[1])
-        max_count = max(domain_counts.values()) if domain_counts else 1
-
+        sorted_domains = sorted(domain_counts.items(), key=itemgetter(1), reverse=True)
+        # Zero checks are hoisted out of the row loops; bar widths use exact
+        # integer floor division so the largest domain always gets a full bar
+        max_count = (sorted_domains[0][1] if sorted_domains else 0) or 1
+        inv_total = 100.0 / total if total > 0 else 0.0
+
+        # Style, name, count and percentage cells are shared by both tables
+        row_cells = []
         for domain, count in sorted_domains:
-            percentage = count / total * 100 if total > 0 else 0
-            bar_width = int(count / max_count * 25) if max_count > 0 else 0
-            bar = "█" * bar_width
-
-            # Get domain style
-            style = (
-                f"domain.{domain}"
-                if domain
-                in [
-                    "finance",
-                    "technology",
-                    "retail",
-                    "logistics",
-                    "healthcare",
-                    "government",
-                    "hr",
-                    "telecommunications",
-                    "social_media",
-                    "education",
-                    "unsure",
-                ]
-                else "white"
+            percentage = count * inv_total
+            style = _domain_style(domain)
+            domain_display = _DISPLAY_NAME.get(domain) or escape(
+                domain.replace("_", " ").title()
+            )
+            row_cells.append(
+                (
+                    style,
+                    f"[{style}]{domain_display}[/]",
+                    _format_int(count),
+                    _format_pct(percentage),
+                )
             )
 
-            # Format domain name
-            domain_display = domain.replace("_", " ").title()
-            if domain == "unsure":
-                domain_display = "⚠️  Unsure"
-
+        for (domain, count), (style, name, count_cell, pct_cell) in zip(
+            sorted_domains, row_cells
+        ):
+            bar_width = count * 25 // max_count
             table.add_row(
-                Text(domain_display, style=style),
-                f"{count:,}",
-                f"{percentage:.1f}%",
-                Text(bar, style=style),
+                name, count_cell, pct_cell, f"[{style}]{_BARS_25[bar_width]}[/]"
             )
 
-        self.console.print()
-        self.console.print()
+        # Collect everything and render it in a single console.print() call
+        parts: list[Any] = ["", ""]
 
         # Enhanced statistics if available
         if enhanced_stats:
@@ -302,7 +497,7 @@ class TerminalUI:
             enhanced_table = Table(
                 title=title,
                 box=box.ROUNDED,
-                border_style="cyan",
+                border_style=_border_style("cyan"),
                 header_style="bold white on dark_blue",
                 show_lines=True,
             )
@@ -314,59 +509,29 @@ class TerminalUI:
             enhanced_table.add_column("Top Labels", width=25)
             enhanced_table.add_column("URL Rate", justify="right", width=10)
 
-            # Sort by count descending
-            sorted_domains = sorted(domain_counts.items(), key=lambda x: -x[1])
-            max_count = max(domain_counts.values()) if domain_counts else 1
-
+            # Reuse sorted_domains and max_count from the basic table above
             # Get enhanced analysis data
             label_analysis = enhanced_stats.get("label_distribution_analysis", {})
             url_analysis = enhanced_stats.get("url_distribution_analysis", {})
 
-            for domain, count in sorted_domains:
-                percentage = count / total * 100 if total > 0 else 0
-                bar_width = (
-                    int(count / max_count * 15) if max_count > 0 else 0
-                )  # Reduced width for other columns
-                bar = "█" * bar_width + "░" * (15 - bar_width)
-
-                # Get domain style
-                style = (
-                    f"domain.{domain}"
-                    if domain
-                    in [
-                        "finance",
-                        "technology",
-                        "retail",
-                        "logistics",
-                        "healthcare",
-                        "government",
-                        "hr",
-                        "telecommunications",
-                        "social_media",
-                        "education",
-                        "unsure",
-                    ]
-                    else "white"
-                )
-
-                # Format domain name
-                domain_display = domain.replace("_", " ").title()
-                if domain == "unsure":
-                    domain_display = "⚠️  Unsure"
+            for (domain, count), (style, name, count_cell, pct_cell) in zip(
+                sorted_domains, row_cells
+            ):
+                # Reduced width for other columns
+                bar_width = count * 15 // max_count
 
                 # Get label information
                 label_info = ""
                 if domain in label_analysis:
-                    data = label_analysis[domain]
+                    distribution = label_analysis[domain]["distribution"]
                     # Get top 2 labels for this domain (to fit in table)
-                    top_labels = sorted(
-                        data["distribution"].items(), key=lambda x: -x[1]["percentage"]
-                    )[:2]
-                    label_parts = [
+                    top_labels = heapq.nlargest(
+                        2, distribution.items(), key=lambda kv: kv[1]["percentage"]
+                    )
+                    label_info = ", ".join(
                         f"{label} ({info['percentage']:.0f}%)"
                         for label, info in top_labels
-                    ]
-                    label_info = ", ".join(label_parts)
+                    )
 
                 # Get URL information
                 url_info = ""
@@ -375,96 +540,106 @@ class TerminalUI:
                     url_info = f"{url_data['with_urls']['percentage']:.0f}%"
 
                 enhanced_table.add_row(
-                    Text(domain_display, style=style),
-                    f"{count:,}",
-                    f"{percentage:.1f}%",
-                    Text(bar, style=style),
+                    name,
+                    count_cell,
+                    pct_cell,
+                    f"[{style}]{_BARS_15[bar_width]}[/]",
                     label_info if label_info else "No data",
                     url_info if url_info else "N/A",
                 )
 
-            self.console.print(enhanced_table)
-            self.console.print()
+            parts.append(enhanced_table)
+            parts.append("")
+
+        self.console.print(Group(*parts))
 
     def print_summary_panel(self, stats: dict[str, Any]) -> None:
         """Display final summary panel."""
-        if self.quiet or not self.console:
+        if not self._enabled:
             return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_summary_panel(stats)
+            return
+
+        from rich.panel import Panel
+        from rich.text import Text
 
         summary = stats.get("summary", {})
         timing = stats.get("timing", {})
-        quality = stats.get("quality_metrics", {})
+        quality = stats.get("quality_metrics")
         validation = stats.get("validation", {})
 
-        # Create summary text
-        content = Text()
-        content.append("📊 Processing Summary\n\n", style="bold cyan")
-
-        content.append("  Total Emails:      ", style="dim")
-        content.append(f"{summary.get('total_emails', 0):,}\n", style="bold white")
-
-        content.append("  Classified:        ", style="dim")
-        content.append(f"{summary.get('classified', 0):,}", style="bold green")
-        content.append(
-            f" ({summary.get('classification_rate_percent', 0)}%)\n", style="green"
-        )
-
-        content.append("  Unsure:            ", style="dim")
-        content.append(f"{summary.get('unsure', 0):,}\n", style="yellow")
-
-        content.append("  Errors:            ", style="dim")
-        error_style = "red" if summary.get("errors", 0) > 0 else "green"
-        content.append(f"{summary.get('errors', 0):,}\n", style=error_style)
+        total_emails = summary.get("total_emails", 0)
+        classified = summary.get("classified", 0)
+        rate = summary.get("classification_rate_percent", 0)
+        unsure = summary.get("unsure", 0)
+        errors = summary.get("errors", 0)
+        total_invalid = validation.get("total_invalid", 0)
+
+        error_style = "red" if errors > 0 else "green"
+
+        # Build the panel as one markup string and parse it in a single pass
+        chunks = [
+            "[bold cyan]📊 Processing Summary\n\n[/]",
+            "[dim]  Total Emails:      [/]",
+            f"[bold white]{total_emails:,}\n[/]",
+            "[dim]  Classified:        [/]",
+            f"[bold green]{classified:,}[/]",
+            f"[green] ({rate}%)\n[/]",
+            "[dim]  Unsure:            [/]",
+            f"[yellow]{unsure:,}\n[/]",
+            "[dim]  Errors:            [/]",
+            f"[{error_style}]{errors:,}\n[/]",
+        ]
 
         # Validation stats if there are any invalid emails
-        if validation.get("total_invalid", 0) > 0:
-            content.append("\n🔍 Validation\n\n", style="bold cyan")
-            content.append("  Invalid (skipped): ", style="dim")
-            content.append(
-                f"{validation.get('total_invalid', 0):,}", style="bold yellow"
-            )
-            content.append(
-                f" ({validation.get('invalid_percentage', 0)}%)\n", style="yellow"
-            )
-            content.append("  (See invalid_emails.csv)\n", style="dim")
+        if total_invalid > 0:
+            chunks += [
+                "[bold cyan]\n🔍 Validation\n\n[/]",
+                "[dim]  Invalid (skipped): [/]",
+                f"[bold yellow]{total_invalid:,}[/]",
+                f"[yellow] ({validation.get('invalid_percentage', 0)}%)\n[/]",
+                f"[dim]  (See {validation.get('file', 'invalid_emails.csv')})\n[/]",
+            ]
 
         # Skipped stats if there are any skipped emails
         skipped = stats.get("skipped", {})
         if skipped.get("total_skipped", 0) > 0:
-            content.append("\n🚫 Skipped Emails\n\n", style="bold cyan")
-            content.append("  Body too long:     ", style="dim")
-            content.append(
-                f"{skipped.get('breakdown', {}).get('body_too_long', 0):,}",
-                style="bold yellow",
-            )
-            content.append(
-                f" ({skipped.get('skipped_percentage', 0)}%)\n", style="yellow"
+            body_too_long = skipped.get("breakdown", {}).get("body_too_long", 0)
+            chunks += [
+                "[bold cyan]\n🚫 Skipped Emails\n\n[/]",
+                "[dim]  Body too long:     [/]",
+                f"[bold yellow]{body_too_long:,}[/]",
+                f"[yellow] ({skipped.get('skipped_percentage', 0)}%)\n[/]",
+                f"[dim]  (See {skipped.get('file', 'skipped_emails.csv')})\n[/]",
+            ]
+
+        chunks += [
+            "[bold cyan]\n⏱️  Performance\n\n[/]",
+            "[dim]  Duration:          [/]",
+            f"[white]{timing.get('duration_seconds', 0):.2f}s\n[/]",
+            "[dim]  Speed:             [/]",
+            f"[white]{timing.get('emails_per_second', 0):.0f} emails/sec\n[/]",
+        ]
+
+        # Quality metrics are absent from summary-only reports
+        if quality is not None:
+            agreement = quality.get("method_agreement_rate", 0)
+            agreement_style = (
+                "green" if agreement > 70 else "yellow" if agreement > 50 else "red"
             )
-            content.append("  (See skipped_emails.csv)\n", style="dim")
-
-        content.append("\n⏱️  Performance\n\n", style="bold cyan")
-
-        content.append("  Duration:          ", style="dim")
-        content.append(f"{timing.get('duration_seconds', 0):.2f}s\n", style="white")
-
-        content.append("  Speed:             ", style="dim")
-        content.append(
-            f"{timing.get('emails_per_second', 0):.0f} emails/sec\n", style="white"
-        )
-
-        content.append("\n📈 Quality Metrics\n\n", style="bold cyan")
-
-        content.append("  Agreement Rate:    ", style="dim")
-        agreement = quality.get("method_agreement_rate", 0)
-        agreement_style = (
-            "green" if agreement > 70 else "yellow" if agreement > 50 else "red"
-        )
-        content.append(f"{agreement}%\n", style=agreement_style)
+            chunks += [
+                "[bold cyan]\n📈 Quality Metrics\n\n[/]",
+                "[dim]  Agreement Rate:    [/]",
+                f"[{agreement_style}]{agreement}%\n[/]",
+            ]
+        content = Text.from_markup("".join(chunks))
 
         panel = Panel(
             content,
             title="[bold white]Results[/bold white]",
-            border_style="green",
+            border_style=_border_style("green"),
             padding=(1, 3),
         )
 
@@ -472,13 +647,21 @@ class TerminalUI:
 
     def print_output_files(self, output_dir: Path, file_counts: dict[str, int]) -> None:
         """Display list of output files created."""
-        if self.quiet or not self.console:
+        if not self._enabled:
+            return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_output_files(output_dir, file_counts)
             return
 
+        from rich import box
+        from rich.console import Group
+        from rich.table import Table
+
         table = Table(
             title="Output Files Generated",
             box=box.ROUNDED,
-            border_style="green",
+            border_style=_border_style("green"),
             show_lines=False,
         )
 
@@ -486,24 +669,34 @@ class TerminalUI:
         table.add_column("Emails", justify="right", style="white")
         table.add_column("Status", justify="center")
 
-        for domain, count in sorted(file_counts.items()):
-            filename = f"email_{domain}.csv"
-            status = "✅" if count > 0 else "⚪"
-            table.add_row(filename, f"{count:,}", status)
-
-        self.console.print()
-        self.console.print(table)
-        self.console.print()
+        rows = [
+            (f"email_{domain}.csv", _format_int(count), "✅" if count > 0 else "⚪")
+            for domain, count in sorted(file_counts.items())
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
-        # Print output directory
         self.console.print(
-            f"  📂 All files saved to: [bold cyan]{output_dir}[/bold cyan]\n"
+            Group(
+                "",
+                table,
+                "",
+                f"  📂 All files saved to: [bold cyan]{output_dir}[/bold cyan]\n",
+            )
         )
 
     def print_recommendations(self, recommendations: list[str]) -> None:
         """Display recommendations panel."""
-        if self.quiet or not self.console or not recommendations:
+        if not self._enabled or not recommendations:
             return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_recommendations(recommendations)
+            return
+
+        from rich.panel import Panel
+        from rich.text import Text
 
         content = Text()
         for i, rec in enumerate(recommendations, 1):
@@ -514,7 +707,7 @@ class TerminalUI:
         panel = Panel(
             content,
             title="[bold]Recommendations[/bold]",
-            border_style="yellow",
+            border_style=_border_style("yellow"),
             padding=(1, 2),
         )
 
@@ -557,8 +750,7 @@ class TerminalUI:
         else:
             print(f"\n? {message} (y/n) ", end="")
 
-        response = input().strip().lower()
-        return response in ("y", "yes")
+        return input().strip().lower() in _YES
 
     def print_analysis_report(self, result: AnalysisResult) -> None:
         """Display dataset analysis report with charts.
@@ -566,23 +758,35 @@ class TerminalUI:
         Args:
             result: AnalysisResult from DatasetAnalyzer.
         """
-        if self.quiet or not self.console:
+        if not self._enabled:
             return
+        assert self.console is not None  # Implied by _enabled
+        if self._plain is not None:
+            self._plain.print_analysis_report(result)
+            return
+
+        # Render every section into one buffer and write it out in one go
+        with self.console.capture() as capture:
+            # Header panel
+            self._print_analysis_header(result)
 
-        # Header panel
-        self._print_analysis_header(result)
+            # Label distribution
+            self._print_label_distribution(result)
 
-        # Label distribution
-        self._print_label_distribution(result)
+            # Body length and sender domains side by side
+            self._print_body_and_domains(result)
 
-        # Body length and sender domains side by side
-        self._print_body_and_domains(result)
+            # Data quality
+            self._print_data_quality(result)
 
-        # Data quality
-        self._print_data_quality(result)
+        self.console.file.write(capture.get())
 
     def _print_analysis_header(self, result: AnalysisResult) -> None:
         """Print file metadata header."""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
         assert self.console is not None  # Called only from print_analysis_report
 
         # Format file size
@@ -594,29 +798,35 @@ class TerminalUI:
         else:
             size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
 
-        header_text = Text()
-        header_text.append("📊 DATASET ANALYSIS\n\n", style="bold cyan")
-        header_text.append("  File:     ", style="dim")
-        header_text.append(f"{result.file_path}\n", style="bold white")
-        header_text.append("  Size:     ", style="dim")
-        header_text.append(f"{size_str}\n", style="white")
-        header_text.append("  Samples:  ", style="dim")
-        header_text.append(f"{result.total_rows:,}\n", style="bold green")
-        header_text.append("  Columns:  ", style="dim")
-        header_text.append(f"{', '.join(result.columns[:6])}", style="white")
+        parts: list[tuple[str, str]] = [
+            ("📊 DATASET ANALYSIS\n\n", "bold cyan"),
+            ("  File:     ", "dim"),
+            (f"{result.file_path}\n", "bold white"),
+            ("  Size:     ", "dim"),
+            (f"{size_str}\n", "white"),
+            ("  Samples:  ", "dim"),
+            (f"{result.total_rows:,}\n", "bold green"),
+            ("  Columns:  ", "dim"),
+            (f"{', '.join(result.columns[:6])}", "white"),
+        ]
         if len(result.columns) > 6:
-            header_text.append(f" (+{len(result.columns) - 6} more)", style="dim")
+            parts.append((f" (+{len(result.columns) - 6} more)", "dim"))
+        header_text = Text.assemble(*parts)
 
         panel = Panel(
             header_text,
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             padding=(0, 2),
         )
-        self.console.print(panel)
-        self.console.print()
+        self.console.print(Group(panel, ""))
 
     def _print_label_distribution(self, result: AnalysisResult) -> None:
         """Print label distribution bar chart."""
+        from rich import box
+        from rich.console import Group
+        from rich.table import Table
+        from rich.text import Text
+
         assert self.console is not None  # Called only from print_analysis_report
         if not result.label_counts:
             return
@@ -624,7 +834,7 @@ class TerminalUI:
         table = Table(
             title="Label Distribution",
             box=box.ROUNDED,
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             show_lines=False,
             padding=(0, 1),
         )
@@ -634,29 +844,31 @@ class TerminalUI:
         table.add_column("Percentage", justify="right", width=10)
         table.add_column("Distribution", width=30)
 
-        # Sort by count descending
-        sorted_labels = sorted(result.label_counts.items(), key=lambda x: -x[1])
-        max_count = max(result.label_counts.values()) if result.label_counts else 1
+        # Top 10 by count descending
+        sorted_labels = heapq.nlargest(
+            10, result.label_counts.items(), key=itemgetter(1)
+        )
+        max_count = sorted_labels[0][1] if sorted_labels else 1
         total = result.total_rows
 
         # Color palette for labels
         colors = ["green", "blue", "magenta", "yellow", "cyan", "red", "white"]
 
-        for idx, (label, count) in enumerate(sorted_labels[:10]):  # Top 10
+        for idx, (label, count) in enumerate(sorted_labels):
             percentage = count / total * 100 if total > 0 else 0
             bar_width = int(count / max_count * 25) if max_count > 0 else 0
-            bar = "█" * bar_width + "░" * (25 - bar_width)
+            bar = _BAR_FULL[:bar_width] + _BAR_EMPTY[: 25 - bar_width]
 
             color = colors[idx % len(colors)]
             table.add_row(
                 Text(label[:20], style=color),
-                f"{count:,}",
-                f"{percentage:.1f}%",
+                _format_int(count),
+                _format_pct(percentage),
                 Text(bar, style=color),
             )
 
-        if len(sorted_labels) > 10:
-            remaining = len(sorted_labels) - 10
+        if len(result.label_counts) > 10:
+            remaining = len(result.label_counts) - 10
             table.add_row(
                 Text(f"(+{remaining} more labels)", style="dim"),
                 "",
@@ -664,188 +876,168 @@ class TerminalUI:
                 "",
             )
 
-        self.console.print(table)
-        self.console.print()
+        self.console.print(Group(table, ""))
 
     def _print_body_and_domains(self, result: AnalysisResult) -> None:
         """Print body length histogram and sender domains."""
         assert self.console is not None  # Called only from print_analysis_report
-        # Create a layout with two columns
         from rich.columns import Columns
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
 
         # Body length histogram
-        body_content = Text()
-        body_content.append("📝 Body Length Distribution\n\n", style="bold cyan")
+        body_parts: list[tuple[str, str]] = [
+            ("📝 Body Length Distribution\n\n", "bold cyan")
+        ]
 
         if result.body_length_buckets:
             max_bucket = max(result.body_length_buckets.values()) or 1
             total = result.total_rows
+            padded_buckets = {
+                name: f"  {name:<10} " for name in result.body_length_buckets
+            }
 
             for bucket_name, count in result.body_length_buckets.items():
                 percentage = count / total * 100 if total > 0 else 0
                 bar_width = int(count / max_bucket * 15) if max_bucket > 0 else 0
-                bar = "█" * bar_width
-
-                body_content.append(f"  {bucket_name:<10} ", style="dim")
-                body_content.append(f"{bar:<15} ", style="cyan")
-                body_content.append(f"{percentage:>5.1f}%\n", style="white")
-
-        body_content.append("\n", style="")
-        body_content.append("  Min:    ", style="dim")
-        body_content.append(f"{result.body_length_min:,} chars\n", style="white")
-        body_content.append("  Max:    ", style="dim")
-        body_content.append(f"{result.body_length_max:,} chars\n", style="white")
-        body_content.append("  Mean:   ", style="dim")
-        body_content.append(f"{result.body_length_mean:,.0f} chars\n", style="white")
-        body_content.append("  Median: ", style="dim")
-        body_content.append(f"{result.body_length_median:,.0f} chars\n", style="white")
+                bar = _BAR_FULL[:bar_width]
+
+                body_parts.append((padded_buckets[bucket_name], "dim"))
+                body_parts.append((f"{bar:<15} ", "cyan"))
+                body_parts.append((f"{percentage:>5.1f}%\n", "white"))
+
+        body_parts += [
+            ("\n", ""),
+            ("  Min:    ", "dim"),
+            (f"{result.body_length_min:,} chars\n", "white"),
+            ("  Max:    ", "dim"),
+            (f"{result.body_length_max:,} chars\n", "white"),
+            ("  Mean:   ", "dim"),
+            (f"{result.body_length_mean:,.0f} chars\n", "white"),
+            ("  Median: ", "dim"),
+            (f"{result.body_length_median:,.0f} chars\n", "white"),
+        ]
+        body_content = Text.assemble(*body_parts)
 
         body_panel = Panel(
             body_content,
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             padding=(0, 1),
         )
 
         # Sender domains
-        domain_content = Text()
-        domain_content.append("📧 Top Sender Domains\n\n", style="bold cyan")
+        domain_parts: list[tuple[str, str]] = [
+            ("📧 Top Sender Domains\n\n", "bold cyan")
+        ]
 
         if result.sender_domain_counts:
-            sorted_domains = sorted(
-                result.sender_domain_counts.items(), key=lambda x: -x[1]
-            )[:8]
+            sorted_domains = heapq.nlargest(
+                8, result.sender_domain_counts.items(), key=itemgetter(1)
+            )
             max_domain = sorted_domains[0][1] if sorted_domains else 1
             total = result.total_rows
+            padded_domains = [f"  {domain[:18]:<18} " for domain, _ in sorted_domains]
 
-            for domain, count in sorted_domains:
+            for padded_domain, (_, count) in zip(padded_domains, sorted_domains):
                 percentage = count / total * 100 if total > 0 else 0
                 bar_width = int(count / max_domain * 10) if max_domain > 0 else 0
-                bar = "█" * bar_width
+                bar = _BAR_FULL[:bar_width]
 
-                domain_content.append(f"  {domain[:18]:<18} ", style="white")
-                domain_content.append(f"{bar:<10} ", style="green")
-                domain_content.append(f"{percentage:>5.1f}%\n", style="dim")
+                domain_parts.append((padded_domain, "white"))
+                domain_parts.append((f"{bar:<10} ", "green"))
+                domain_parts.append((f"{percentage:>5.1f}%\n", "dim"))
 
             if result.total_unique_domains > 8:
                 remaining = result.total_unique_domains - 8
-                domain_content.append(f"\n  (+{remaining} more domains)\n", style="dim")
+                domain_parts.append((f"\n  (+{remaining} more domains)\n", "dim"))
         else:
-            domain_content.append("  No valid sender domains found\n", style="dim")
+            domain_parts.append(("  No valid sender domains found\n", "dim"))
 
-        domain_content.append("\n", style="")
-        domain_content.append("  Total unique: ", style="dim")
-        domain_content.append(f"{result.total_unique_domains:,}\n", style="white")
+        domain_parts += [
+            ("\n", ""),
+            ("  Total unique: ", "dim"),
+            (f"{result.total_unique_domains:,}\n", "white"),
+        ]
+        domain_content = Text.assemble(*domain_parts)
 
         domain_panel = Panel(
             domain_content,
-            border_style="green",
+            border_style=_border_style("green"),
             padding=(0, 1),
         )
 
-        self.console.print(Columns([body_panel, domain_panel], equal=True))
-        self.console.print()
+        # Lay the two panels out side by side
+        self.console.print(Group(Columns([body_panel, domain_panel], equal=True), ""))
 
     def _print_data_quality(self, result: AnalysisResult) -> None:
         """Print data quality summary."""
-        assert self.console is not None  # Called only from print_analysis_report
-        content = Text()
-        content.append("🔍 Data Quality Summary\n\n", style="bold cyan")
+        from rich.panel import Panel
+        from rich.text import Text
 
+        assert self.console is not None  # Called only from print_analysis_report
         total = result.total_rows
-        issues_found = False
-
-        # URL presence
-        content.append("  URL Presence:     ", style="dim")
-        content.append(
-            f"{result.url_percentage:.1f}% of emails contain URLs\n", style="white"
-        )
-
-        # Subject stats
-        content.append("  Subject Length:   ", style="dim")
-        content.append(f"avg {result.subject_length_mean:.0f} chars\n", style="white")
-
-        content.append("\n", style="")
+        parts: list[tuple[str, str]] = [
+            ("🔍 Data Quality Summary\n\n", "bold cyan"),
+            # URL presence
+            ("  URL Presence:     ", "dim"),
+            (f"{result.url_percentage:.1f}% of emails contain URLs\n", "white"),
+            # Subject stats
+            ("  Subject Length:   ", "dim"),
+            (f"avg {result.subject_length_mean:.0f} chars\n", "white"),
+            ("\n", ""),
+        ]
 
         # Check for issues
-        if result.empty_sender_count > 0:
-            pct = result.empty_sender_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Empty sender: {result.empty_sender_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if result.empty_receiver_count > 0:
-            pct = result.empty_receiver_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Empty receiver: {result.empty_receiver_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if result.empty_subject_count > 0:
-            pct = result.empty_subject_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Empty subject: {result.empty_subject_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if result.empty_body_count > 0:
-            pct = result.empty_body_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Empty body: {result.empty_body_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if result.invalid_sender_format_count > 0:
-            pct = result.invalid_sender_format_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Invalid sender format: {result.invalid_sender_format_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if result.invalid_receiver_format_count > 0:
-            pct = result.invalid_receiver_format_count / total * 100 if total > 0 else 0
-            content.append("  ⚠ ", style="yellow")
-            content.append(
-                f"Invalid receiver format: {result.invalid_receiver_format_count:,} ({pct:.1f}%)\n",
-                style="yellow",
-            )
-            issues_found = True
-
-        if not issues_found:
-            content.append("  ✓ ", style="green")
-            content.append("All required fields present and valid\n", style="green")
+        issues = (
+            ("Empty sender", result.empty_sender_count),
+            ("Empty receiver", result.empty_receiver_count),
+            ("Empty subject", result.empty_subject_count),
+            ("Empty body", result.empty_body_count),
+            ("Invalid sender format", result.invalid_sender_format_count),
+            ("Invalid receiver format", result.invalid_receiver_format_count),
+        )
+        issues_found = False
+        for label, count in issues:
+            if count > 0:
+                pct = count / total * 100 if total > 0 else 0
+                parts.append(("  ⚠ ", "yellow"))
+                parts.append((f"{label}: {count:,} ({pct:.1f}%)\n", "yellow"))
+                issues_found = True
 
-        # Recommendations
         if issues_found:
-            content.append("\n  💡 ", style="cyan")
-            content.append(
-                "Use --strict-validation during classification to skip invalid emails\n",
-                style="dim",
+            # Recommendations
+            parts.append(("\n  💡 ", "cyan"))
+            parts.append(
+                (
+                    "Use --strict-validation during classification to skip "
+                    "invalid emails\n",
+                    "dim",
+                )
             )
+        else:
+            parts.append(("  ✓ ", "green"))
+            parts.append(("All required fields present and valid\n", "green"))
+        content = Text.assemble(*parts)
 
         panel = Panel(
             content,
-            border_style="cyan",
+            border_style=_border_style("cyan"),
             padding=(0, 2),
         )
         self.console.print(panel)
 
 
-class SimpleUI:
+class SimpleUI(BaseUI):
     """Fallback simple UI when Rich is not available."""
 
+    # Minimum number of seconds between two progress redraws
+    PROGRESS_INTERVAL = 0.25
+
     def __init__(self, quiet: bool = False) -> None:
-        self.quiet = quiet
+        super().__init__(quiet)
+        self._last_filled = -1
+        self._last_print_ts = 0.0
 
     def print_banner(self) -> None:
         if self.quiet:
@@ -869,13 +1061,25 @@ class SimpleUI:
     def print_progress(self, current: int, total: int, status: str = "") -> None:
         if self.quiet:
             return
-        pct = current / total * 100 if total > 0 else 0
         bar_len = 40
         filled = int(bar_len * current / total) if total > 0 else 0
-        bar = "█" * filled + "░" * (bar_len - filled)
+        done = current >= total
+        now = time.monotonic()
+        # Only redraw when the visible bar moves, at most PROGRESS_INTERVAL
+        # apart; every redraw is flushed
+        if not done and (
+            filled == self._last_filled
+            or now - self._last_print_ts < self.PROGRESS_INTERVAL
+        ):
+            return
+        self._last_filled = -1 if done else filled
+        self._last_print_ts = now
+
+        pct = current / total * 100 if total > 0 else 0
+        bar = _BAR_FULL[:filled] + _BAR_EMPTY[: bar_len - filled]
         print(f"\r[{bar}] {pct:5.1f}% - {status}", end="", flush=True)
-        if current >= total:
-            print()
+        if done:
+            print(flush=True)
 
     def print_domain_stats(
         self,
@@ -886,13 +1090,49 @@ class SimpleUI:
     ) -> None:
         if self.quiet:
             return
-        print("\n" + "-" * 50)
-        print("Domain Classification Results:")
-        print("-" * 50)
-        for domain, count in sorted(domain_counts.items(), key=lambda x: -x[1]):
-            pct = count / total * 100 if total > 0 else 0
-            print(f"  {domain:<20} {count:>8,} ({pct:>5.1f}%)")
-        print("-" * 50 + "\n")
+        scale = 100 / total if total > 0 else 0
+        lines = ["", "-" * 50, "Domain Classification Results:", "-" * 50]
+        lines.extend(
+            f"  {domain:<20} {count:>8,} ({count * scale:>5.1f}%)"
+            for domain, count in sorted(
+                domain_counts.items(), key=itemgetter(1), reverse=True
+            )
+        )
+        lines.append("-" * 50)
+
+        # Same per-domain label and URL breakdown as the Rich enhanced table
+        if enhanced_stats:
+            label_analysis = enhanced_stats.get("label_distribution_analysis", {})
+            url_analysis = enhanced_stats.get("url_distribution_analysis", {})
+            title = "Email classified by domain"
+            if input_file:
+                title = f"{title} - {input_file}"
+            lines += ["", f"{title}:", "-" * 50]
+            for domain, _ in sorted(
+                domain_counts.items(), key=itemgetter(1), reverse=True
+            ):
+                label_info = "No data"
+                if domain in label_analysis:
+                    top_labels = heapq.nlargest(
+                        2,
+                        label_analysis[domain]["distribution"].items(),
+                        key=lambda kv: kv[1]["percentage"],
+                    )
+                    label_info = ", ".join(
+                        f"{label} ({info['percentage']:.0f}%)"
+                        for label, info in top_labels
+                    )
+                url_info = "N/A"
+                if domain in url_analysis:
+                    url_data = url_analysis[domain]
+                    url_info = f"{url_data['with_urls']['percentage']:.0f}%"
+                lines.append(
+                    f"  {domain:<20} labels: {label_info}; URL rate: {url_info}"
+                )
+            lines.append("-" * 50)
+
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
 
     def print_summary_panel(self, stats: dict[str, Any]) -> None:
         """Display final summary panel (simple version)."""
@@ -900,13 +1140,42 @@ class SimpleUI:
             return
         summary = stats.get("summary", {})
         timing = stats.get("timing", {})
-        print("\n" + "-" * 50)
-        print("Summary:")
-        print(f"  Total: {summary.get('total_emails', 0):,}")
-        print(f"  Classified: {summary.get('classified', 0):,}")
-        print(f"  Unsure: {summary.get('unsure', 0):,}")
-        print(f"  Duration: {timing.get('duration_seconds', 0):.2f}s")
-        print("-" * 50 + "\n")
+        validation = stats.get("validation", {})
+        skipped = stats.get("skipped", {})
+        quality = stats.get("quality_metrics")
+        lines = [
+            "",
+            "-" * 50,
+            "Summary:",
+            f"  Total: {summary.get('total_emails', 0):,}",
+            f"  Classified: {summary.get('classified', 0):,}",
+            f"  Unsure: {summary.get('unsure', 0):,}",
+            f"  Errors: {summary.get('errors', 0):,}",
+        ]
+        if validation.get("total_invalid", 0) > 0:
+            lines.append(
+                f"  Invalid (skipped): {validation['total_invalid']:,} "
+                f"({validation.get('invalid_percentage', 0)}%) "
+                f"- see {validation.get('file', 'invalid_emails.csv')}"
+            )
+        if skipped.get("total_skipped", 0) > 0:
+            body_too_long = skipped.get("breakdown", {}).get("body_too_long", 0)
+            lines.append(
+                f"  Body too long: {body_too_long:,} "
+                f"({skipped.get('skipped_percentage', 0)}%) "
+                f"- see {skipped.get('file', 'skipped_emails.csv')}"
+            )
+        lines += [
+            f"  Duration: {timing.get('duration_seconds', 0):.2f}s",
+            f"  Speed: {timing.get('emails_per_second', 0):.0f} emails/sec",
+        ]
+        # Quality metrics are absent from summary-only reports
+        if quality is not None:
+            lines.append(
+                f"  Agreement Rate: {quality.get('method_agreement_rate', 0)}%"
+            )
+        lines += ["-" * 50, ""]
+        print("\n".join(lines))
 
     def print_output_files(self, output_dir: Path, file_counts: dict[str, int]) -> None:
         """Display list of output files created (simple version)."""
@@ -926,27 +1195,6 @@ class SimpleUI:
             print(f"  {i}. {rec}")
         print()
 
-    def create_progress(self) -> None:
-        """No-op for simple UI - progress not supported."""
-        return None
-
-    def create_status_bar(self) -> StatusBar:
-        """Create a status bar for real-time updates (simple fallback)."""
-        return StatusBar(console=None, quiet=self.quiet)
-
-    def print_error(self, message: str) -> None:
-        print(f"ERROR: {message}", file=sys.stderr)
-
-    def print_warning(self, message: str) -> None:
-        print(f"WARNING: {message}", file=sys.stderr)
-
-    def print_success(self, message: str) -> None:
-        print(f"✓ {message}")
-
-    def print_info(self, message: str) -> None:
-        if not self.quiet:
-            print(f"ℹ {message}")
-
     def print_analysis_report(self, result: AnalysisResult) -> None:
         """Display dataset analysis report (simple version)."""
         if self.quiet:
@@ -962,7 +1210,9 @@ class SimpleUI:
 
         print("Label Distribution:")
         print("-" * 40)
-        for label, count in sorted(result.label_counts.items(), key=lambda x: -x[1]):
+        for label, count in sorted(
+            result.label_counts.items(), key=itemgetter(1), reverse=True
+        ):
             pct = count / result.total_rows * 100 if result.total_rows > 0 else 0
             print(f"  {label:<20} {count:>8,} ({pct:>5.1f}%)")
         print()
@@ -977,9 +1227,9 @@ class SimpleUI:
 
         print("Top Sender Domains:")
         print("-" * 40)
-        for domain, count in sorted(
-            result.sender_domain_counts.items(), key=lambda x: -x[1]
-        )[:10]:
+        for domain, count in heapq.nlargest(
+            10, result.sender_domain_counts.items(), key=itemgetter(1)
+        ):
             pct = count / result.total_rows * 100 if result.total_rows > 0 else 0
             print(f"  {domain:<25} {count:>6,} ({pct:>5.1f}%)")
         print()
@@ -987,15 +1237,48 @@ class SimpleUI:
         print("Data Quality:")
         print("-" * 40)
         print(f"  URL Presence: {result.url_percentage:.1f}%")
-        if result.empty_body_count > 0:
-            print(f"  ⚠ Empty body: {result.empty_body_count:,}")
-        if result.invalid_sender_format_count > 0:
-            print(f"  ⚠ Invalid sender: {result.invalid_sender_format_count:,}")
+        print(f"  Subject Length: avg {result.subject_length_mean:.0f} chars")
+        issues = (
+            ("Empty sender", result.empty_sender_count),
+            ("Empty receiver", result.empty_receiver_count),
+            ("Empty subject", result.empty_subject_count),
+            ("Empty body", result.empty_body_count),
+            ("Invalid sender format", result.invalid_sender_format_count),
+            ("Invalid receiver format", result.invalid_receiver_format_count),
+        )
+        total = result.total_rows
+        for label, count in issues:
+            if count > 0:
+                pct = count / total * 100 if total > 0 else 0
+                print(f"  ⚠ {label}: {count:,} ({pct:.1f}%)")
         print("=" * 60 + "\n")
 
 
-def get_ui(quiet: bool = False) -> TerminalUI | SimpleUI:
+class _NullUI(BaseUI):
+    """Quiet-mode UI: only errors and warnings reach the terminal."""
+
+    def __init__(self) -> None:
+        super().__init__(quiet=True)
+
+    def _noop(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    print_success = print_info = _noop
+
+    def print_error(self, message: str) -> None:
+        print(f"\nError: {message}\n", file=sys.stderr)
+
+    def print_warning(self, message: str) -> None:
+        print(f"Warning: {message}", file=sys.stderr)
+
+
+_NULL_UI = _NullUI()
+
+
+def get_ui(quiet: bool = False) -> BaseUI:
     """Get appropriate UI based on available libraries."""
+    if quiet:
+        return _NULL_UI
     if RICH_AVAILABLE:
         return TerminalUI(quiet=quiet)
     else:
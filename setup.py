@@ -49,9 +49,14 @@ setup(
         "rich>=13.0.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.9.0",
+            "google-re2>=1.1",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "isort>=5.0.0",
             "mypy>=1.0.0",
@@ -0,0 +1,27 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from email_classifier import EmailClassifier
+from email_classifier.classifier import (
+    KeywordTaxonomyClassifier,
+    StructuralTemplateClassifier,
+)
+
+
+@pytest.fixture(scope="session")
+def email_classifier():
+    """Shared EmailClassifier; classification does not mutate it."""
+    return EmailClassifier()
+
+
+@pytest.fixture(scope="session")
+def kw_classifier():
+    """Shared KeywordTaxonomyClassifier."""
+    return KeywordTaxonomyClassifier()
+
+
+@pytest.fixture(scope="session")
+def struct_classifier():
+    """Shared StructuralTemplateClassifier."""
+    return StructuralTemplateClassifier()
@@ -10,6 +10,74 @@ from email_classifier.classifier import (
 )
 from email_classifier.domains import DOMAINS
 
+_DEFAULT_EMAIL_FIELDS = {
+    "sender": "test@example.com",
+    "receiver": "user@domain.com",
+    "date": "2024-01-15",
+    "subject": "Test",
+    "body": "",
+    "urls": "",
+}
+
+
+def _email(**fields):
+    """Build an EmailData from test defaults, overriding the given fields."""
+    return EmailData(**{**_DEFAULT_EMAIL_FIELDS, **fields})
+
+
+FINANCE_EMAIL = {
+    "sender": "alerts@bank.com",
+    "receiver": "customer@email.com",
+    "date": "2024-01-15",
+    "subject": "Your account statement is ready",
+    "body": "Dear Customer, Your monthly bank statement is now available. "
+    "Please review your recent transactions and account balance. "
+    "Your current balance is $1,234.56. Transfer funds securely online.",
+    "urls": "https://bank.com/statement",
+}
+
+HEALTHCARE_EMAIL = {
+    "sender": "appointments@hospital.com",
+    "receiver": "patient@email.com",
+    "date": "2024-01-15",
+    "subject": "Appointment Reminder - Dr. Smith",
+    "body": "Dear Patient, This is a reminder for your appointment with "
+    "Dr. Smith on Monday. Please bring your insurance card and medical records. "
+    "Your prescription is ready at the pharmacy. HIPAA Notice: This message is confidential.",
+    "urls": "",
+}
+
+RETAIL_EMAIL = {
+    "sender": "orders@shop.com",
+    "receiver": "customer@email.com",
+    "date": "2024-01-15",
+    "subject": "Order Confirmation #12345",
+    "body": "Thank you for your purchase! Your order has been confirmed. "
+    "Items: Product ABC - $29.99. Total: $32.99 with shipping. "
+    "Your package will be shipped within 2 business days. Track your delivery online.",
+    "urls": "https://shop.com/track",
+}
+
+TECHNOLOGY_EMAIL = {
+    "sender": "noreply@techservice.com",
+    "receiver": "user@email.com",
+    "date": "2024-01-15",
+    "subject": "Password Reset Request",
+    "body": "We received a request to reset your password. "
+    "Click the link below to update your account credentials. "
+    "Your subscription will expire in 30 days. Update your software for security.",
+    "urls": "https://tech.com/reset",
+}
+
+AMBIGUOUS_EMAIL = {
+    "sender": "unknown@random.xyz",
+    "receiver": "user@email.com",
+    "date": "2024-01-15",
+    "subject": "Hello",
+    "body": "Hi there.",
+    "urls": "",
+}
+
 
 class TestEmailClassifier:
     """Test cases for EmailClassifier class."""
@@ -21,9 +89,8 @@ class TestEmailClassifier:
         assert hasattr(classifier, "method1")
         assert hasattr(classifier, "method2")
 
-    def test_classify_dict_basic(self):
+    def test_classify_dict_basic(self, email_classifier):
         """Test basic classification with dictionary input."""
-        classifier = EmailClassifier()
         email_data = {
             "sender": "test@example.com",
             "receiver": "user@domain.com",
@@ -33,7 +100,7 @@ class TestEmailClassifier:
             "has_url": False,
         }
 
-        domain, details = classifier.classify_dict(email_data)
+        domain, details = email_classifier.classify_dict(email_data)
         assert isinstance(domain, str)
         assert isinstance(details, dict)
         assert "method1" in details
@@ -81,6 +148,18 @@ class TestEmailClassifier:
         email = EmailData.from_dict(data)
         assert email.has_url is False
 
+    def test_email_data_whitespace_urls(self):
+        """Test a whitespace-only urls value does not count as a URL."""
+        assert _email(urls="  \n").has_url is False
+        assert _email(urls=" http://example.com ").has_url is True
+
+    def test_email_data_uses_slots(self):
+        """Test EmailData has no per-instance __dict__ and stays mutable."""
+        email = EmailData.from_dict({"sender": "test@example.com"})
+        assert not hasattr(email, "__dict__")
+        email.urls = "http://example.com"
+        assert email.has_url is True
+
     def test_email_data_missing_fields(self):
         """Test EmailData handles missing fields gracefully."""
         data = {}
@@ -91,98 +170,39 @@ class TestEmailClassifier:
         assert email.body == ""
         assert email.has_url is False
 
-    def test_classify_finance_email(self):
-        """Test classification of finance-related email."""
-        classifier = EmailClassifier()
-        email_data = {
-            "sender": "alerts@bank.com",
-            "receiver": "customer@email.com",
-            "date": "2024-01-15",
-            "subject": "Your account statement is ready",
-            "body": "Dear Customer, Your monthly bank statement is now available. "
-            "Please review your recent transactions and account balance. "
-            "Your current balance is $1,234.56. Transfer funds securely online.",
-            "urls": "https://bank.com/statement",
-        }
-        domain, details = classifier.classify_dict(email_data)
-        assert domain == "finance"
-        assert details["method1"]["domain"] == "finance"
-
-    def test_classify_healthcare_email(self):
-        """Test classification of healthcare-related email."""
-        classifier = EmailClassifier()
-        email_data = {
-            "sender": "appointments@hospital.com",
-            "receiver": "patient@email.com",
-            "date": "2024-01-15",
-            "subject": "Appointment Reminder - Dr. Smith",
-            "body": "Dear Patient, This is a reminder for your appointment with "
-            "Dr. Smith on Monday. Please bring your insurance card and medical records. "
-            "Your prescription is ready at the pharmacy. HIPAA Notice: This message is confidential.",
-            "urls": "",
-        }
-        domain, details = classifier.classify_dict(email_data)
-        assert domain == "healthcare"
-
-    def test_classify_retail_email(self):
-        """Test classification of retail-related email."""
-        classifier = EmailClassifier()
-        email_data = {
-            "sender": "orders@shop.com",
-            "receiver": "customer@email.com",
-            "date": "2024-01-15",
-            "subject": "Order Confirmation #12345",
-            "body": "Thank you for your purchase! Your order has been confirmed. "
-            "Items: Product ABC - $29.99. Total: $32.99 with shipping. "
-            "Your package will be shipped within 2 business days. Track your delivery online.",
-            "urls": "https://shop.com/track",
-        }
-        domain, details = classifier.classify_dict(email_data)
-        assert domain == "retail"
-
-    def test_classify_technology_email(self):
-        """Test classification of technology-related email."""
-        classifier = EmailClassifier()
-        email_data = {
-            "sender": "noreply@techservice.com",
-            "receiver": "user@email.com",
-            "date": "2024-01-15",
-            "subject": "Password Reset Request",
-            "body": "We received a request to reset your password. "
-            "Click the link below to update your account credentials. "
-            "Your subscription will expire in 30 days. Update your software for security.",
-            "urls": "https://tech.com/reset",
-        }
-        domain, details = classifier.classify_dict(email_data)
-        assert domain == "technology"
-
-    def test_classify_unsure_low_confidence(self):
-        """Test classification returns unsure for ambiguous emails."""
-        classifier = EmailClassifier()
-        email_data = {
-            "sender": "unknown@random.xyz",
-            "receiver": "user@email.com",
-            "date": "2024-01-15",
-            "subject": "Hello",
-            "body": "Hi there.",
-            "urls": "",
-        }
-        domain, details = classifier.classify_dict(email_data)
-        # Could be unsure or might match something due to low thresholds
+    @pytest.mark.parametrize(
+        "email_data,expected",
+        [
+            (FINANCE_EMAIL, "finance"),
+            (HEALTHCARE_EMAIL, "healthcare"),
+            (RETAIL_EMAIL, "retail"),
+            (TECHNOLOGY_EMAIL, "technology"),
+            # Could be unsure or might match something due to low thresholds
+            (AMBIGUOUS_EMAIL, None),
+        ],
+        ids=["finance", "healthcare", "retail", "technology", "ambiguous"],
+    )
+    def test_classify_domain(self, email_classifier, email_data, expected):
+        """Test classification of domain-specific and ambiguous emails."""
+        domain, details = email_classifier.classify_dict(email_data)
         assert domain is not None
+        assert expected is None or domain == expected
+
+    def test_classify_finance_email_keyword_method(self, email_classifier):
+        """Test that keyword taxonomy alone picks finance for a finance email."""
+        domain, details = email_classifier.classify_dict(FINANCE_EMAIL)
+        assert details["method1"]["domain"] == "finance"
 
-    def test_classifier_llm_disabled_by_default(self):
+    def test_classifier_llm_disabled_by_default(self, email_classifier):
         """Test that LLM is disabled by default."""
-        classifier = EmailClassifier()
-        assert classifier.llm_enabled is False
-        assert classifier.method3 is None
-        assert classifier.weight_method_1 == 0.6
-        assert classifier.weight_method_2 == 0.4
-        assert classifier.weight_method_3 == 0.0
+        assert email_classifier.llm_enabled is False
+        assert email_classifier.method3 is None
+        assert email_classifier.weight_method_1 == 0.6
+        assert email_classifier.weight_method_2 == 0.4
+        assert email_classifier.weight_method_3 == 0.0
 
-    def test_classifier_method_weights_structure(self):
+    def test_classifier_method_weights_structure(self, email_classifier):
         """Test that method weights are included in classification details."""
-        classifier = EmailClassifier()
         email_data = {
             "sender": "test@example.com",
             "receiver": "user@domain.com",
@@ -191,7 +211,7 @@ class TestEmailClassifier:
             "body": "Test body content",
             "urls": "",
         }
-        domain, details = classifier.classify_dict(email_data)
+        domain, details = email_classifier.classify_dict(email_data)
         assert "method_weights" in details
         assert "method1" in details["method_weights"]
         assert "method2" in details["method_weights"]
@@ -214,107 +234,65 @@ class TestKeywordTaxonomyClassifier:
         assert "custom" in classifier.domains
         assert len(classifier.domains) == 1
 
-    def test_classify_returns_classification_result(self):
+    def test_classify_returns_classification_result(self, kw_classifier):
         """Test classify returns ClassificationResult."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Test body",
-            urls="",
-        )
-        result = classifier.classify(email)
+        email = _email(body="Test body")
+        result = kw_classifier.classify(email)
         assert isinstance(result, ClassificationResult)
         assert result.method == "keyword_taxonomy"
 
-    def test_classify_with_primary_keywords_in_subject(self):
+    def test_classify_with_primary_keywords_in_subject(self, kw_classifier):
         """Test keywords in subject increase score."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
+        email = _email(
             sender="test@bank.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
             subject="Your account balance statement",
             body="Please check your account.",
-            urls="",
         )
-        result = classifier.classify(email)
+        result = kw_classifier.classify(email)
         assert result.scores["finance"] > 0
 
-    def test_classify_with_secondary_keywords_in_body(self):
+    def test_classify_with_secondary_keywords_in_body(self, kw_classifier):
         """Test secondary keywords in body contribute to score."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
+        email = _email(
             subject="Information",
             body="Your financial funds transfer is pending. Money exchange rate updated.",
-            urls="",
         )
-        result = classifier.classify(email)
+        result = kw_classifier.classify(email)
         assert result.scores["finance"] > 0
 
-    def test_classify_sender_pattern_match(self):
+    def test_classify_sender_pattern_match(self, kw_classifier):
         """Test sender pattern matching."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
+        email = _email(
             sender="alerts@bankofamerica.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
             subject="Notice",
             body="Important update.",
-            urls="",
         )
-        result = classifier.classify(email)
+        result = kw_classifier.classify(email)
         # Should match bank pattern
         assert result.details is not None
         assert result.details["finance"]["sender_match"] is True
 
-    def test_classify_subject_pattern_match(self):
+    def test_classify_subject_pattern_match(self, kw_classifier):
         """Test subject pattern matching."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
+        email = _email(
             subject="Your transaction has been processed",
             body="Details enclosed.",
-            urls="",
         )
-        result = classifier.classify(email)
+        result = kw_classifier.classify(email)
         assert result.details is not None
         assert result.details["finance"]["subject_pattern_match"] is True
 
-    def test_classify_empty_body(self):
+    def test_classify_empty_body(self, kw_classifier):
         """Test classification with empty body."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="",
-            urls="",
-        )
-        result = classifier.classify(email)
+        email = _email(body="")
+        result = kw_classifier.classify(email)
         # Should not crash, confidence should be low
         assert result is not None
 
-    def test_classify_below_confidence_threshold(self):
+    def test_classify_below_confidence_threshold(self, kw_classifier):
         """Test that low confidence returns None domain."""
-        classifier = KeywordTaxonomyClassifier()
-        email = EmailData(
-            sender="random@xyz.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="xyz",
-            body="xyz",
-            urls="",
-        )
-        result = classifier.classify(email)
+        email = _email(sender="random@xyz.com", subject="xyz", body="xyz")
+        result = kw_classifier.classify(email)
         # With no matching keywords, confidence should be low
         assert result.confidence < 0.1 or result.domain is None
 
@@ -333,182 +311,101 @@ class TestStructuralTemplateClassifier:
         classifier = StructuralTemplateClassifier(domains=custom_domains)
         assert "custom" in classifier.domains
 
-    def test_classify_returns_classification_result(self):
+    def test_classify_returns_classification_result(self, struct_classifier):
         """Test classify returns ClassificationResult."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Test body content here.",
-            urls="",
-        )
-        result = classifier.classify(email)
+        email = _email(body="Test body content here.")
+        result = struct_classifier.classify(email)
         assert isinstance(result, ClassificationResult)
         assert result.method == "structural_template"
 
-    def test_extract_features_greeting(self):
-        """Test greeting detection in features."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Dear Customer,\n\nThis is a test message.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["has_greeting"] is True
-
-    def test_extract_features_no_greeting(self):
-        """Test no greeting detected."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Your order has shipped.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["has_greeting"] is False
-
-    def test_extract_features_signature(self):
-        """Test signature detection."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Message content.\n\nBest regards,\nJohn",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["has_signature"] is True
-
-    def test_extract_features_disclaimer(self):
-        """Test disclaimer detection."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Content here.\n\nThis email is confidential and intended for the recipient only.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["has_disclaimer"] is True
-
-    def test_extract_features_paragraph_count(self):
-        """Test paragraph counting."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="First paragraph.\n\nSecond paragraph.\n\nThird paragraph.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["paragraph_count"] == 3
-
-    def test_extract_features_formality_formal(self):
-        """Test formal language detection."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Pursuant to our discussion, please find enclosed the document. "
-            "Regarding your inquiry, we hereby confirm the receipt. Respectfully submitted.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["formality"] == "formal"
-
-    def test_extract_features_formality_casual(self):
-        """Test casual language detection."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Hey! That's awesome!! BTW gonna check it out :) Cool stuff FYI!",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["formality"] == "casual"
-
-    def test_extract_features_formality_semiformal(self):
-        """Test semi-formal language detection."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="test@example.com",
-            receiver="user@domain.com",
-            date="2024-01-15",
-            subject="Test",
-            body="Hello, I wanted to follow up on our conversation. Thanks for your time.",
-            urls="",
-        )
-        features = classifier._extract_features(email)
-        assert features["formality"] == "semi-formal"
-
-    def test_analyze_sender_noreply(self):
+    @pytest.mark.parametrize(
+        "body, expected",
+        [
+            ("Dear Customer,\n\nThis is a test message.", {"has_greeting": True}),
+            ("Your order has shipped.", {"has_greeting": False}),
+            ("Message content.\n\nBest regards,\nJohn", {"has_signature": True}),
+            (
+                "Content here.\n\nThis email is confidential and intended for the recipient only.",
+                {"has_disclaimer": True},
+            ),
+            (
+                "First paragraph.\n\nSecond paragraph.\n\nThird paragraph.",
+                {"paragraph_count": 3},
+            ),
+            (
+                "Pursuant to our discussion, please find enclosed the document. "
+                "Regarding your inquiry, we hereby confirm the receipt. Respectfully submitted.",
+                {"formality": "formal"},
+            ),
+            (
+                "Hey! That's awesome!! BTW gonna check it out :) Cool stuff FYI!",
+                {"formality": "casual"},
+            ),
+            (
+                "Hello, I wanted to follow up on our conversation. Thanks for your time.",
+                {"formality": "semi-formal"},
+            ),
+        ],
+        ids=[
+            "greeting",
+            "no_greeting",
+            "signature",
+            "disclaimer",
+            "paragraph_count",
+            "formality_formal",
+            "formality_casual",
+            "formality_semiformal",
+        ],
+    )
+    def test_extract_features(self, struct_classifier, body, expected):
+        """Test greeting, signature, disclaimer, paragraph and formality features."""
+        features = struct_classifier._extract_features(_email(body=body))
+        for key, value in expected.items():
+            assert features[key] == value
+            assert type(features[key]) is type(value)
+
+    def test_analyze_sender_noreply(self, struct_classifier):
         """Test noreply sender detection."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("noreply@company.com")
+        features = struct_classifier._analyze_sender_structure("noreply@company.com")
         assert features["is_noreply"] is True
 
-    def test_analyze_sender_donotreply(self):
+    def test_analyze_sender_donotreply(self, struct_classifier):
         """Test donotreply sender detection."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("donotreply@company.com")
+        features = struct_classifier._analyze_sender_structure("donotreply@company.com")
         assert features["is_noreply"] is True
 
-    def test_analyze_sender_department(self):
+    def test_analyze_sender_department(self, struct_classifier):
         """Test department detection in sender."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("support@company.com")
+        features = struct_classifier._analyze_sender_structure("support@company.com")
         assert features["has_department"] is True
 
-        features = classifier._analyze_sender_structure("billing@company.com")
+        features = struct_classifier._analyze_sender_structure("billing@company.com")
         assert features["has_department"] is True
 
-    def test_analyze_sender_domain_gov(self):
+    def test_analyze_sender_domain_gov(self, struct_classifier):
         """Test .gov domain detection."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("notice@agency.gov")
+        features = struct_classifier._analyze_sender_structure("notice@agency.gov")
         assert features["domain_type"] == "government"
 
-    def test_analyze_sender_domain_edu(self):
+    def test_analyze_sender_domain_edu(self, struct_classifier):
         """Test .edu domain detection."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("registrar@university.edu")
+        features = struct_classifier._analyze_sender_structure(
+            "registrar@university.edu"
+        )
         assert features["domain_type"] == "education"
 
-    def test_analyze_sender_domain_commercial(self):
+    def test_analyze_sender_domain_commercial(self, struct_classifier):
         """Test commercial domain detection."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("info@company.com")
+        features = struct_classifier._analyze_sender_structure("info@company.com")
         assert features["domain_type"] == "commercial"
 
-    def test_analyze_sender_no_at_symbol(self):
+    def test_analyze_sender_no_at_symbol(self, struct_classifier):
         """Test sender without @ symbol."""
-        classifier = StructuralTemplateClassifier()
-        features = classifier._analyze_sender_structure("support")
+        features = struct_classifier._analyze_sender_structure("support")
         assert features["has_department"] is True
 
-    def test_score_template_body_length_match(self):
+    def test_score_template_body_length_match(self, struct_classifier):
         """Test body length scoring - exact match."""
-        classifier = StructuralTemplateClassifier()
         features = {
             "body_length": 500,
             "has_greeting": True,
@@ -523,14 +420,13 @@ class TestStructuralTemplateClassifier:
                 "has_department": False,
             },
         }
-        score, details = classifier._score_template_match(
+        score, details = struct_classifier._score_template_match(
             features, DOMAINS["technology"]
         )
         assert details["body_length"] == "match"
 
-    def test_score_template_body_length_partial(self):
+    def test_score_template_body_length_partial(self, struct_classifier):
         """Test body length scoring - partial match."""
-        classifier = StructuralTemplateClassifier()
         features = {
             "body_length": 80,  # Below typical but not extreme
             "has_greeting": True,
@@ -545,14 +441,13 @@ class TestStructuralTemplateClassifier:
                 "has_department": False,
             },
         }
-        score, details = classifier._score_template_match(
+        score, details = struct_classifier._score_template_match(
             features, DOMAINS["technology"]
         )
         assert details["body_length"] == "partial"
 
-    def test_score_template_body_length_mismatch(self):
+    def test_score_template_body_length_mismatch(self, struct_classifier):
         """Test body length scoring - mismatch."""
-        classifier = StructuralTemplateClassifier()
         features = {
             "body_length": 10,  # Very short
             "has_greeting": True,
@@ -567,14 +462,13 @@ class TestStructuralTemplateClassifier:
                 "has_department": False,
             },
         }
-        score, details = classifier._score_template_match(
+        score, details = struct_classifier._score_template_match(
             features, DOMAINS["technology"]
         )
         assert details["body_length"] == "mismatch"
 
-    def test_score_template_formality_mismatch(self):
+    def test_score_template_formality_mismatch(self, struct_classifier):
         """Test formality mismatch scoring."""
-        classifier = StructuralTemplateClassifier()
         features = {
             "body_length": 500,
             "has_greeting": True,
@@ -589,12 +483,13 @@ class TestStructuralTemplateClassifier:
                 "has_department": False,
             },
         }
-        score, details = classifier._score_template_match(features, DOMAINS["finance"])
+        score, details = struct_classifier._score_template_match(
+            features, DOMAINS["finance"]
+        )
         assert details["formality"] == "mismatch"
 
-    def test_score_template_noreply_match(self):
+    def test_score_template_noreply_match(self, struct_classifier):
         """Test noreply sender scoring for technology/retail/logistics."""
-        classifier = StructuralTemplateClassifier()
         features = {
             "body_length": 500,
             "has_greeting": True,
@@ -609,23 +504,15 @@ class TestStructuralTemplateClassifier:
                 "has_department": False,
             },
         }
-        score, details = classifier._score_template_match(
+        score, details = struct_classifier._score_template_match(
             features, DOMAINS["technology"]
         )
         assert details["sender"] == "noreply_match"
 
-    def test_classify_zero_total_scores(self):
+    def test_classify_zero_total_scores(self, struct_classifier):
         """Test handling when all scores are zero."""
-        classifier = StructuralTemplateClassifier()
-        email = EmailData(
-            sender="x@y.z",
-            receiver="a@b.c",
-            date="2024-01-15",
-            subject="x",
-            body="x",
-            urls="",
-        )
-        result = classifier.classify(email)
+        email = _email(sender="x@y.z", receiver="a@b.c", subject="x", body="x")
+        result = struct_classifier.classify(email)
         # Should handle gracefully
         assert result is not None
 
@@ -666,6 +553,16 @@ class TestClassificationResult:
         )
         assert result.domain is None
 
+    def test_uses_slots(self):
+        """Test ClassificationResult instances carry no per-instance __dict__."""
+        result = ClassificationResult(
+            domain=None,
+            confidence=0.0,
+            scores={},
+            method="test",
+        )
+        assert not hasattr(result, "__dict__")
+
 
 class TestHybridClassifier:
     """Test cases for HybridClassifier class."""
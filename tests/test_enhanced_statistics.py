@@ -1,12 +1,14 @@
 """Tests for enhanced statistics collection and reporting."""
 
 import csv
+import json
 import tempfile
 from collections import defaultdict
 from pathlib import Path
 
 import pytest
 
+from email_classifier import reporter as reporter_module
 from email_classifier.classifier import EmailClassifier
 from email_classifier.processor import ProcessingStats, StreamingProcessor
 from email_classifier.reporter import ClassificationReporter
@@ -126,6 +128,37 @@ class TestEnhancedStatistics:
         assert "banking" in cross_analysis["finance"]["labels"]
         assert cross_analysis["finance"]["labels"]["banking"]["with_urls"] == 5
 
+    def test_label_distribution_sorted_by_count(self):
+        """Test label distribution is ordered by count with rounded percentages."""
+        reporter = ClassificationReporter()
+        stats = ProcessingStats()
+
+        stats.label_distributions["finance"]["loans"] = 1
+        stats.label_distributions["finance"]["banking"] = 4
+        stats.label_distributions["finance"]["investment"] = 1
+
+        analysis = reporter._generate_label_distribution_analysis(stats)
+        distribution = analysis["finance"]["distribution"]
+
+        assert list(distribution) == ["banking", "loans", "investment"]
+        assert distribution["banking"]["percentage"] == 66.67
+        assert distribution["loans"]["percentage"] == 16.67
+
+    def test_domain_breakdown_skips_empty_domains(self):
+        """Test zero-count domains are dropped from the breakdown except unsure."""
+        stats = ProcessingStats()
+        stats.total_processed = 4
+        stats.domain_counts["finance"] = 4
+        stats.domain_counts["retail"] = 0
+        stats.domain_counts["unsure"] = 0
+
+        report = ClassificationReporter().generate_report(stats, Path("/tmp"))
+        breakdown = report["domain_breakdown"]
+
+        assert list(breakdown) == ["finance", "unsure"]
+        assert breakdown["finance"]["percentage"] == 100.0
+        assert breakdown["finance"]["display_name"] == "💰 Finance"
+
     def test_enhanced_report_generation(self):
         """Test that enhanced report includes new sections."""
         reporter = ClassificationReporter()
@@ -156,6 +189,47 @@ class TestEnhancedStatistics:
         assert report["label_distribution_analysis"]["finance"]["total_emails"] == 8
         assert report["url_distribution_analysis"]["finance"]["with_urls"]["count"] == 6
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_json_report_round_trip(self, use_orjson, monkeypatch, tmp_path):
+        """Test JSON report output is identical with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(reporter_module, "ORJSON_AVAILABLE", use_orjson)
+
+        stats = ProcessingStats()
+        stats.total_processed = 3
+        stats.total_classified = 3
+        stats.domain_counts["finance"] = 3
+        stats.label_distributions["finance"]["Überweisung"] = 3
+
+        reporter = ClassificationReporter()
+        report = reporter.generate_report(stats, tmp_path)
+        output_path = tmp_path / "classification_report.json"
+        reporter.save_json_report(report, output_path)
+
+        content = output_path.read_text(encoding="utf-8")
+        assert json.loads(content) == report
+        assert "Überweisung" in content
+        assert content.startswith('{\n  "meta"')
+
+    def test_generate_summary_only_feeds_terminal_summary(self):
+        """Test the summary-only path matches the full report for the banner."""
+        stats = ProcessingStats()
+        stats.total_processed = 4
+        stats.total_classified = 3
+        stats.total_unsure = 1
+        stats.domain_counts["finance"] = 3
+        stats.domain_counts["unsure"] = 1
+
+        reporter = ClassificationReporter()
+        full = reporter.generate_report(stats, Path("/tmp"))
+        summary_only = reporter.generate_summary_only(stats)
+
+        assert set(summary_only) == {"summary", "timing"}
+        assert reporter.format_terminal_summary(
+            summary_only
+        ) == reporter.format_terminal_summary(full)
+
     def test_streaming_processor_enhanced_collection(self):
         """Test that StreamingProcessor collects enhanced statistics."""
         # Create temporary CSV file with test data
@@ -232,6 +232,28 @@ class TestBackwardCompatibility:
 
             assert result.returncode == 0
 
+    def test_classify_no_report_prints_summary(self, sample_csv_file):
+        """Test --no-report still prints a summary but writes no report files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "email_classifier.cli",
+                    "classify",
+                    str(sample_csv_file),
+                    "-o",
+                    tmpdir,
+                    "--no-report",
+                ],
+                capture_output=True,
+                text=True,
+            )
+
+            assert result.returncode == 0
+            assert "Classified:" in result.stdout
+            assert not (Path(tmpdir) / "classification_report.json").exists()
+
     def test_help_shows_subcommands(self):
         """Test that help shows available subcommands."""
         result = subprocess.run(
@@ -3,6 +3,7 @@ Integration tests for email validation and output standardization.
 """
 
 import csv
+import gzip
 import tempfile
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import pytest
 
 from email_classifier.classifier import EmailClassifier
 from email_classifier.processor import OutputManager, StreamingProcessor
+from email_classifier.reporter import ClassificationReporter
 
 
 class TestIntegrationValidation:
@@ -593,3 +595,123 @@ class TestMaxBodyLengthFiltering:
             assert "skipped" in stats_dict
             assert stats_dict["skipped"]["total_skipped"] == 2
             assert stats_dict["skipped"]["skipped_body_too_long"] == 2
+
+    def test_repeated_emails_classified_once_per_run(self, monkeypatch):
+        """Test that identical emails in one run reuse a single classification."""
+        calls = []
+        original = EmailClassifier.classify_dict
+
+        def counting_classify_dict(self, email_dict):
+            calls.append(email_dict["sender"])
+            return original(self, email_dict)
+
+        monkeypatch.setattr(EmailClassifier, "classify_dict", counting_classify_dict)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.csv"
+            output_dir = Path(tmpdir) / "output"
+
+            template = {
+                "sender": "alerts@bank.com",
+                "receiver": "recipient@example.com",
+                "subject": "Your account statement is ready",
+                "body": "Your monthly bank statement and balance are available.",
+                "timestamp": "2024-01-15",
+                "has_url": "false",
+            }
+            data = [
+                template,
+                dict(template, receiver="other@example.com", timestamp="2024-02-01"),
+                dict(template, sender="support@shop.com"),
+            ]
+            self.create_test_csv(data, list(template), input_path)
+
+            processor = StreamingProcessor()
+            stats = processor.process(input_path, output_dir)
+            # A second run starts with an empty cache
+            processor.process(input_path, output_dir)
+
+            assert stats.total_processed == 3
+            assert sum(stats.domain_counts.values()) == 3
+            assert calls == ["alerts@bank.com", "support@shop.com"] * 2
+
+    def test_compress_side_files(self):
+        """Test that invalid and skipped emails can be written gzip-compressed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.csv"
+            output_dir = Path(tmpdir) / "output"
+
+            data = [
+                {
+                    "sender": "invalid-sender",
+                    "receiver": "recipient@example.com",
+                    "subject": "Invalid Sender",
+                    "body": "Short body",
+                },
+                {
+                    "sender": "long@example.com",
+                    "receiver": "recipient@example.com",
+                    "subject": "Long",
+                    "body": "L" * 500,
+                },
+            ]
+            self.create_test_csv(data, list(data[0]), input_path)
+
+            processor = StreamingProcessor(
+                max_body_length=100, compress_side_files=True
+            )
+            processor.process(input_path, output_dir)
+
+            assert not (output_dir / "invalid_emails.csv").exists()
+            with gzip.open(output_dir / "invalid_emails.csv.gz", "rt") as f:
+                invalid_rows = list(csv.DictReader(f))
+            with gzip.open(output_dir / "skipped_emails.csv.gz", "rt") as f:
+                skipped_rows = list(csv.DictReader(f))
+
+            assert [r["sender"] for r in invalid_rows] == ["invalid-sender"]
+            assert [r["skip_reason"] for r in skipped_rows] == ["body_too_long"]
+
+            # The report points at the files that were actually written
+            report = ClassificationReporter().generate_report(
+                processor.stats, output_dir
+            )
+            assert report["validation"]["file"] == "invalid_emails.csv.gz"
+            assert report["skipped"]["file"] == "skipped_emails.csv.gz"
+            report_path = output_dir / "report.txt"
+            ClassificationReporter().save_text_report(report, report_path)
+            text = report_path.read_text()
+            assert "(See invalid_emails.csv.gz for details)" in text
+            assert "(See skipped_emails.csv.gz for details)" in text
+
+    def test_classify_cache_keeps_recently_used_entries(self, monkeypatch):
+        """Test that the per-run cache evicts the least recently used email."""
+        calls = []
+        original = EmailClassifier.classify_dict
+
+        def counting_classify_dict(self, email_dict):
+            calls.append(email_dict["subject"])
+            return original(self, email_dict)
+
+        monkeypatch.setattr(EmailClassifier, "classify_dict", counting_classify_dict)
+
+        processor = StreamingProcessor()
+        monkeypatch.setattr(processor, "CLASSIFY_CACHE_SIZE", 2)
+        cache = {}
+
+        def row(subject):
+            return {
+                "sender": "alerts@bank.com",
+                "subject": subject,
+                "body": "Your statement is ready.",
+                "urls": "",
+            }
+
+        for subject in ["template", "a", "template", "b", "template", "a"]:
+            processor._classify_row(row(subject), cache)
+
+        # "template" stays cached; "a" is evicted by "b" and classified again
+        assert calls == ["template", "a", "b", "a"]
+        assert list(cache) == [
+            ("alerts@bank.com", "template", "Your statement is ready.", ""),
+            ("alerts@bank.com", "a", "Your statement is ready.", ""),
+        ]
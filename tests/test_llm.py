@@ -406,11 +406,8 @@ class TestLLMClassifierIntegration:
             # Just verify it doesn't crash
             assert classifier is not None
 
-    def test_classify_without_llm(self):
+    def test_classify_without_llm(self, email_classifier):
         """Test classification works without LLM."""
-        from email_classifier import EmailClassifier
-
-        classifier = EmailClassifier()
         email_data = {
             "sender": "alerts@bank.com",
             "receiver": "customer@email.com",
@@ -420,7 +417,7 @@ class TestLLMClassifierIntegration:
             "Please review your recent transactions.",
             "urls": "",
         }
-        domain, details = classifier.classify_dict(email_data)
+        domain, details = email_classifier.classify_dict(email_data)
         assert isinstance(domain, str)
         assert "method1" in details
         assert "method2" in details
@@ -3,6 +3,7 @@ Unit tests for email validation functionality.
 """
 
 import csv
+import gzip
 import tempfile
 from pathlib import Path
 
@@ -15,6 +16,7 @@ from email_classifier.validator import (
     SkippedStats,
     ValidationResult,
     ValidationStats,
+    _is_valid_email,
 )
 
 
@@ -77,6 +79,22 @@ class TestEmailValidator:
                 email
             ), f"Should be invalid: {email}"
 
+    def test_combined_pattern_anchoring(self, validator):
+        """Test that the combined pattern keeps both formats fully anchored."""
+        assert not validator.validate_email_format("a@b")
+        assert validator.validate_email_format("Name <a@b.co>")
+        assert not validator.validate_email_format("a@b.co>")
+        assert not validator.validate_email_format("Name <a@b.co")
+        assert not validator.validate_email_format("Name <a@b.co> trailing")
+
+    def test_repeated_addresses_use_cache(self, validator):
+        """Test that repeated addresses are answered from the match cache."""
+        _is_valid_email.cache_clear()
+        assert validator.validate_email_format("user@example.com")
+        assert validator.validate_email_format("  user@example.com ")
+        info = _is_valid_email.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_none_email_returns_false(self, validator):
         """Test that None email returns False (not valid)."""
         # The validator should handle None gracefully by returning False
@@ -138,6 +156,22 @@ class TestEmailValidator:
         assert not result.is_valid
         assert "invalid_sender_format" in result.errors
 
+    def test_validate_uses_overridden_format_check(self):
+        """Test that validate() honours a subclass validate_email_format."""
+
+        class StrictValidator(EmailValidator):
+            def validate_email_format(self, email: str) -> bool:
+                return email.endswith("@example.com")
+
+        email_dict = {
+            "sender": "sender@other.org",
+            "receiver": "receiver@example.com",
+            "subject": "Test Subject",
+            "body": "This is the email body.",
+        }
+        result = StrictValidator().validate(email_dict)
+        assert result.errors == ["invalid_sender_format"]
+
     def test_invalid_receiver_format_fails(self, validator):
         """Test that invalid receiver format fails validation."""
         email_dict = {
@@ -223,6 +257,45 @@ class TestEmailValidator:
         assert "empty_subject" in result.errors
         assert "empty_body" in result.errors
 
+    def test_errors_decoded_from_mask_in_check_order(self, validator):
+        """Test that error codes come back in sender/receiver/subject/body order."""
+        result = validator.validate({"sender": "bad", "body": "Body"})
+        assert result.errors == [
+            "invalid_sender_format",
+            "empty_receiver",
+            "empty_subject",
+        ]
+
+    def test_valid_record_result(self, validator):
+        """Test that valid records return an error-free result."""
+        email_dict = {
+            "sender": "sender@example.com",
+            "receiver": "receiver@example.com",
+            "subject": "Test Subject",
+            "body": "Body",
+        }
+        result = validator.validate(email_dict)
+        assert result == ValidationResult(is_valid=True)
+        assert result.errors == []
+
+    def test_results_do_not_share_errors(self, validator):
+        """Test that each result owns its errors list."""
+        email_dict = {
+            "sender": "sender@example.com",
+            "receiver": "receiver@example.com",
+            "subject": "Test Subject",
+            "body": "Body",
+        }
+        first = validator.validate(email_dict)
+        first.errors.append("custom_check")
+        assert validator.validate(email_dict).errors == []
+
+    def test_result_constructed_with_errors(self):
+        """Test the public ValidationResult constructor."""
+        result = ValidationResult(is_valid=False, errors=["empty_body"])
+        result.errors.append("empty_subject")
+        assert result.errors == ["empty_body", "empty_subject"]
+
 
 class TestInvalidEmailWriter:
     """Tests for InvalidEmailWriter class."""
@@ -338,10 +411,71 @@ class TestInvalidEmailWriter:
             csv_path = output_dir / "invalid_emails.csv"
             assert csv_path.exists()
 
+    def test_rows_beyond_one_batch_are_all_written(self):
+        """Test that batched rows are written in order across batch boundaries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            fieldnames = ["sender", "receiver", "subject", "body"]
+
+            with InvalidEmailWriter(output_dir, fieldnames) as writer:
+                for i in range(2500):
+                    writer.write(
+                        {
+                            "sender": f"bad{i}",
+                            "receiver": "",
+                            "subject": "S",
+                            "body": "B",
+                        },
+                        ["invalid_sender_format", "empty_receiver"],
+                    )
+
+            with open(writer.filepath, encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+
+            assert len(rows) == 2500
+            assert [r["sender"] for r in rows[:2]] == ["bad0", "bad1"]
+            assert rows[-1]["sender"] == "bad2499"
+
+    def test_compressed_output(self):
+        """Test writing invalid emails to a gzip-compressed CSV file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            fieldnames = ["sender", "receiver", "subject", "body"]
+
+            with InvalidEmailWriter(output_dir, fieldnames, compress=True) as writer:
+                writer.write(
+                    {
+                        "sender": "bad",
+                        "receiver": "r@e.com",
+                        "subject": "S",
+                        "body": "B",
+                    },
+                    ["invalid_sender_format"],
+                )
+
+            assert writer.filepath == output_dir / "invalid_emails.csv.gz"
+            with gzip.open(writer.filepath, "rt", encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+
+            assert len(rows) == 1
+            assert rows[0]["sender"] == "bad"
+            assert rows[0]["validation_errors"] == "invalid_sender_format"
+
 
 class TestValidationStats:
     """Tests for ValidationStats class."""
 
+    def test_record_counts_errors(self):
+        """Test that record() counts the email and each known error code."""
+        stats = ValidationStats()
+        stats.record(["empty_sender", "invalid_receiver_format"])
+        stats.record(["empty_body", "unknown_error"])
+        assert stats.total_invalid == 2
+        assert stats.invalid_empty_sender == 1
+        assert stats.invalid_receiver_format == 1
+        assert stats.invalid_empty_body == 1
+        assert stats.invalid_sender_format == 0
+
     def test_default_values(self):
         """Test that ValidationStats initializes with zeros."""
         stats = ValidationStats()